@@ -1,9 +1,11 @@
 import json
-import re
+import os
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+import orjson
 from scrapy import signals
 
 
@@ -11,11 +13,32 @@ def _repo_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
 
-def _atomic_write(path: Path, text: str) -> None:
+def _atomic_write(path: Path, data: bytes) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp_path = path.with_suffix(path.suffix + ".tmp")
-    tmp_path.write_text(text, encoding="utf-8")
-    tmp_path.replace(path)
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+
+def _fsync_dir(path: Path) -> None:
+    # Persists the renames done by _atomic_write; called once per directory, not per file.
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
 
 
 def _state_path() -> Path:
@@ -32,18 +55,45 @@ def _read_state() -> dict[str, Any]:
     return state
 
 
+def _dumps_pretty(obj: Any) -> bytes:
+    # For the state and vote payloads written here this matches json.dumps(obj,
+    # ensure_ascii=False, indent=2, sort_keys=True) + "\n" byte for byte.
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS) + b"\n"
+
+
 def _write_state(state: dict[str, Any]) -> None:
     state["schema_version"] = 1
-    payload = json.dumps(state, ensure_ascii=False, indent=2, sort_keys=True) + "\n"
-    _atomic_write(_state_path(), payload)
+    path = _state_path()
+    _atomic_write(path, _dumps_pretty(state))
+    _fsync_dir(path.parent)
+
+
+def _is_numeric_id(value: str) -> bool:
+    return value.isascii() and value.isdigit()
+
+
+# Fields that change on every fetch without the vote itself changing.
+_VOLATILE_VOTE_FIELDS = frozenset({"fetched_at_utc", "force_overwrite"})
+
 
+def _same_vote_content(path: Path, item: dict[str, Any]) -> bool:
+    try:
+        existing = orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return False
+    if not isinstance(existing, dict):
+        return False
+    return _stable_vote_fields(existing) == _stable_vote_fields(item)
 
-_VOTE_ID_RE = re.compile(r"^[0-9]+$")
+
+def _stable_vote_fields(payload: dict[str, Any]) -> dict[str, Any]:
+    return {k: v for k, v in payload.items() if k not in _VOLATILE_VOTE_FIELDS}
 
 
 class RawJsonPipeline:
     def __init__(self) -> None:
         self._max_vote_id: int | None = None
+        self._written_dirs: set[Path] = set()
 
     @classmethod
     def from_crawler(cls, crawler):
@@ -56,7 +106,7 @@ class RawJsonPipeline:
             return item
 
         vote_id = str(item.get("vote_id") or "")
-        if not _VOTE_ID_RE.match(vote_id):
+        if not _is_numeric_id(vote_id):
             raise ValueError(f"Invalid vote_id: {vote_id!r}")
 
         vote_id_int = int(vote_id)
@@ -66,14 +116,22 @@ class RawJsonPipeline:
             self._max_vote_id = max(self._max_vote_id, vote_id_int)
 
         out_path = _repo_root() / "data" / "raw" / "votes" / f"{vote_id}.json"
-        if out_path.exists() and not item.get("force_overwrite"):
-            return item
-
-        payload = json.dumps(item, ensure_ascii=False, indent=2, sort_keys=True) + "\n"
-        _atomic_write(out_path, payload)
+        if out_path.exists():
+            if not item.get("force_overwrite"):
+                return item
+            if _same_vote_content(out_path, item):
+                # Leave the file (and its mtime) alone when a forced re-fetch found no changes.
+                return item
+
+        _atomic_write(out_path, _dumps_pretty(item))
+        self._written_dirs.add(out_path.parent)
         return item
 
     def _on_spider_closed(self, spider, reason: str) -> None:
+        for directory in self._written_dirs:
+            _fsync_dir(directory)
+        self._written_dirs.clear()
+
         if reason != "finished":
             return
         if self._max_vote_id is None:
@@ -87,8 +145,7 @@ class RawJsonPipeline:
         _write_state(state)
 
 
-_TERM_ID_RE = re.compile(r"^[0-9]+$")
-_MEETING_ID_RE = re.compile(r"^[0-9]+$")
+_TMP_SHARD_BUFFER_SIZE = 1 << 16
 
 
 class VoteIndexJsonlPipeline:
@@ -104,6 +161,7 @@ class VoteIndexJsonlPipeline:
     def __init__(self) -> None:
         self._tmp_files: dict[tuple[int, int], Path] = {}
         self._tmp_fhs: dict[tuple[int, int], Any] = {}
+        self._done_meetings: set[tuple[int, int]] = set()
 
     @classmethod
     def from_crawler(cls, crawler):
@@ -112,6 +170,9 @@ class VoteIndexJsonlPipeline:
         return pipeline
 
     def process_item(self, item: dict[str, Any]):
+        if item.get("kind") == "meeting_done":
+            self._done_meetings.add((int(item["term_id"]), int(item["meeting_id"])))
+            return item
         if item.get("kind") != "vote_index":
             return item
 
@@ -119,11 +180,11 @@ class VoteIndexJsonlPipeline:
         meeting_id_raw = str(item.get("meeting_id") or "")
         vote_id_raw = str(item.get("vote_id") or "")
 
-        if not _TERM_ID_RE.match(term_id_raw):
+        if not _is_numeric_id(term_id_raw):
             raise ValueError(f"Invalid term_id: {term_id_raw!r}")
-        if not _MEETING_ID_RE.match(meeting_id_raw):
+        if not _is_numeric_id(meeting_id_raw):
             raise ValueError(f"Invalid meeting_id: {meeting_id_raw!r}")
-        if not _VOTE_ID_RE.match(vote_id_raw):
+        if not _is_numeric_id(vote_id_raw):
             raise ValueError(f"Invalid vote_id: {vote_id_raw!r}")
 
         term_id = int(term_id_raw)
@@ -136,11 +197,14 @@ class VoteIndexJsonlPipeline:
 
         if key not in self._tmp_fhs:
             self._tmp_files[key] = tmp_path
-            self._tmp_fhs[key] = tmp_path.open("a", encoding="utf-8")
+            # Binary append with a large buffer: a backfill appends thousands of short lines per
+            # shard, and they reach the kernel in a few big writes instead of one per 8 KiB.
+            self._tmp_fhs[key] = tmp_path.open("ab", buffering=_TMP_SHARD_BUFFER_SIZE)
 
-        # Do not mutate the input item; normalize the payload we persist.
+        # Do not mutate the input item; normalize the payload we persist. The .tmp lines are
+        # re-serialized with json.dumps when merged, so orjson's compact form is fine here.
         payload = {k: v for k, v in item.items() if k != "kind"}
-        self._tmp_fhs[key].write(json.dumps(payload, ensure_ascii=False, sort_keys=True) + "\n")
+        self._tmp_fhs[key].write(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS) + b"\n")
         return item
 
     def _on_spider_closed(self, spider, reason: str) -> None:
@@ -149,34 +213,85 @@ class VoteIndexJsonlPipeline:
         self._tmp_fhs.clear()
 
         if reason != "finished":
+            # Meetings completed so far are merged and recorded now, so an interrupted backfill
+            # can skip them on resume; the other .tmp shards wait for the next finished run.
+            if self._done_meetings:
+                _merge_vote_index_shards(
+                    path for key, path in self._tmp_files.items() if key in self._done_meetings
+                )
+                state = _read_state()
+                _record_done_meetings(state, self._done_meetings)
+                _write_state(state)
             return
 
-        for (term_id, meeting_id), tmp_path in self._tmp_files.items():
-            out_path = tmp_path.with_suffix("")  # remove ".tmp"
-
-            merged: dict[int, dict[str, Any]] = {}
-            if out_path.exists():
-                for line in out_path.read_text(encoding="utf-8").splitlines():
-                    if not line.strip():
-                        continue
-                    rec = json.loads(line)
-                    merged[int(rec["vote_id"])] = rec
-
-            if tmp_path.exists():
-                for line in tmp_path.read_text(encoding="utf-8").splitlines():
-                    if not line.strip():
-                        continue
-                    rec = json.loads(line)
-                    merged[int(rec["vote_id"])] = rec
-
-            lines = [
-                json.dumps(merged[vote_id], ensure_ascii=False, sort_keys=True)
-                for vote_id in sorted(merged)
-            ]
-            _atomic_write(out_path, "\n".join(lines) + ("\n" if lines else ""))
-            tmp_path.unlink(missing_ok=True)
+        # Pick up .tmp shards left by an interrupted run for meetings not revisited this time.
+        index_root = _repo_root() / "data" / "raw" / "vote_index"
+        for tmp_path in index_root.glob("*/*.jsonl.tmp"):
+            term_raw, meeting_raw = tmp_path.parent.name, tmp_path.name.split(".", 1)[0]
+            if _is_numeric_id(term_raw) and _is_numeric_id(meeting_raw):
+                self._tmp_files.setdefault((int(term_raw), int(meeting_raw)), tmp_path)
+        _merge_vote_index_shards(self._tmp_files.values())
 
         state = _read_state()
         vote_index = state.setdefault("vote_index", {})
         vote_index["updated_at_utc"] = datetime.now(UTC).replace(microsecond=0).isoformat()
+        _record_done_meetings(state, self._done_meetings)
         _write_state(state)
+
+
+def _merge_vote_index_shards(tmp_paths: Iterable[Path]) -> None:
+    # Folds each <meeting>.jsonl.tmp into its <meeting>.jsonl shard (unique, sorted by vote_id).
+    written_dirs: set[Path] = set()
+    for tmp_path in tmp_paths:
+        out_path = tmp_path.with_suffix("")  # remove ".tmp"
+
+        merged: dict[int, dict[str, Any]] = {}
+        if out_path.exists():
+            for line in out_path.read_text(encoding="utf-8").splitlines():
+                if not line.strip():
+                    continue
+                rec = json.loads(line)
+                merged[int(rec["vote_id"])] = rec
+
+        if tmp_path.exists():
+            for line in tmp_path.read_text(encoding="utf-8").splitlines():
+                if not line.strip():
+                    continue
+                rec = json.loads(line)
+                merged[int(rec["vote_id"])] = rec
+
+        lines = [
+            json.dumps(merged[vote_id], ensure_ascii=False, sort_keys=True)
+            for vote_id in sorted(merged)
+        ]
+        _atomic_write(out_path, ("\n".join(lines) + ("\n" if lines else "")).encode("utf-8"))
+        written_dirs.add(out_path.parent)
+        tmp_path.unlink(missing_ok=True)
+    for directory in written_dirs:
+        _fsync_dir(directory)
+
+
+def _record_done_meetings(state: dict[str, Any], meetings: set[tuple[int, int]]) -> None:
+    # state["vote_index"]["done_meetings"] = {"<term_id>": [meeting_id, ...]}, sorted.
+    if not meetings:
+        return
+    done = state.setdefault("vote_index", {}).setdefault("done_meetings", {})
+    for term_id, meeting_id in meetings:
+        ids = set(done.get(str(term_id)) or [])
+        ids.add(meeting_id)
+        done[str(term_id)] = sorted(ids)
+
+
+def _load_done_meetings() -> set[tuple[int, int]]:
+    # Read side of _record_done_meetings; a missing or unreadable state file means none are done.
+    try:
+        state = _read_state()
+    except json.JSONDecodeError:
+        return set()
+    done = (state.get("vote_index") or {}).get("done_meetings") or {}
+    out: set[tuple[int, int]] = set()
+    for term_id, meeting_ids in done.items():
+        if not str(term_id).isdigit():
+            continue
+        out.update((int(term_id), int(m)) for m in meeting_ids if isinstance(m, int))
+    return out
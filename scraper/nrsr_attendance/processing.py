@@ -1,19 +1,26 @@
 from __future__ import annotations
 
-import json
+import multiprocessing
+import os
 import re
 import shutil
+import sys
 import unicodedata
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
+import orjson
 import polars as pl
 
 BRATISLAVA_TZ = ZoneInfo("Europe/Bratislava")
 
 
+@lru_cache(maxsize=4096)
 def _normalize_key(value: str) -> str:
     normalized = unicodedata.normalize("NFKD", value)
     normalized = "".join(ch for ch in normalized if not unicodedata.combining(ch))
@@ -22,9 +29,11 @@ def _normalize_key(value: str) -> str:
     return normalized
 
 
+# ASCII digits only; \s stays Unicode-aware because scraped labels may carry no-break spaces.
 _SK_DT_RE = re.compile(
-    r"^\s*(\d{1,2})\.\s*(\d{1,2})\.\s*(\d{4})\s+(\d{1,2}):(\d{2})(?::(\d{2}))?\s*$"
+    r"^\s*([0-9]{1,2})\.\s*([0-9]{1,2})\.\s*([0-9]{4})\s+([0-9]{1,2}):([0-9]{2})(?::([0-9]{2}))?\s*$"
 )
+_SK_DT_MATCH = _SK_DT_RE.match
 
 
 def parse_sk_datetime_to_utc(value: str | None) -> datetime | None:
@@ -34,10 +43,41 @@ def parse_sk_datetime_to_utc(value: str | None) -> datetime | None:
     return local_dt.astimezone(UTC)
 
 
+def _digits(value: str, min_len: int, max_len: int) -> bool:
+    return min_len <= len(value) <= max_len and value.isascii() and value.isdigit()
+
+
 def parse_sk_datetime_to_local(value: str | None) -> datetime | None:
     if not value:
         return None
-    match = _SK_DT_RE.match(value)
+
+    # Fast path for the usual "D. M. YYYY HH:MM[:SS]" shape; anything else goes through the regex.
+    date_part, _, time_part = value.strip().rpartition(" ")
+    date_fields = date_part.split(".")
+    time_fields = time_part.split(":")
+    if len(date_fields) == 3 and len(time_fields) in (2, 3):
+        day, month, year = date_fields[0], date_fields[1].lstrip(), date_fields[2].lstrip()
+        hour, minute = time_fields[0], time_fields[1]
+        second = time_fields[2] if len(time_fields) == 3 else "0"
+        if (
+            _digits(day, 1, 2)
+            and _digits(month, 1, 2)
+            and _digits(year, 4, 4)
+            and _digits(hour, 1, 2)
+            and _digits(minute, 2, 2)
+            and (len(time_fields) == 2 or _digits(second, 2, 2))
+        ):
+            return datetime(
+                int(year),
+                int(month),
+                int(day),
+                int(hour),
+                int(minute),
+                int(second),
+                tzinfo=BRATISLAVA_TZ,
+            )
+
+    match = _SK_DT_MATCH(value)
     if not match:
         return None
     day, month, year, hour, minute, second = match.groups()
@@ -52,24 +92,22 @@ def parse_sk_datetime_to_local(value: str | None) -> datetime | None:
     )
 
 
-def _stats_get(stats: dict[str, int] | None, key: str) -> int | None:
-    if not stats:
-        return None
-    target = _normalize_key(key)
-    for k, v in stats.items():
-        if _normalize_key(k) == target:
-            return v
-    return None
+_PRESENT_KEY = _normalize_key("Prítomní")
+_VOTING_KEY = _normalize_key("Hlasujúcich")
 
 
-def _stats_get_code(stats: dict[str, int] | None, code: str) -> int | None:
-    if not stats:
-        return None
-    code_prefix = f"[{code}]"
+# Index stats by normalized label and by "[code]" prefix; the first matching key wins.
+def _stats_lookups(stats: dict[str, int]) -> tuple[dict[str, int], dict[str, int]]:
+    by_key: dict[str, int] = {}
+    by_code: dict[str, int] = {}
     for k, v in stats.items():
-        if k.strip().startswith(code_prefix):
-            return v
-    return None
+        by_key.setdefault(_normalize_key(k), v)
+        label = k.strip()
+        if label.startswith("["):
+            end = label.find("]")
+            if end > 0:
+                by_code.setdefault(label[1:end], v)
+    return by_key, by_code
 
 
 def _safe_int(value: str | int | None) -> int | None:
@@ -121,48 +159,33 @@ _MP_VOTES_SCHEMA_OVERRIDES = {
     "vote_datetime_utc": pl.Utf8,
     "mp_id": pl.Int64,
     "mp_name": pl.Utf8,
-    "club": pl.Utf8,
-    "vote_code": pl.Utf8,
-    "is_present": pl.Boolean,
-    "is_voted": pl.Boolean,
+    # Low-cardinality labels: stored as categoricals while processing, written out as strings.
+    "club": pl.Categorical,
+    "vote_code": pl.Categorical,
 }
 
 
-def _df_from_records(
-    records: list[dict], *, schema_overrides: dict[str, pl.DataType]
-) -> pl.DataFrame:
-    if records:
-        return pl.DataFrame(records, schema_overrides=schema_overrides)
-    return pl.DataFrame(schema=schema_overrides)
-
-
 def _normalize_club(value: object) -> str:
     if not isinstance(value, str):
         return _UNKNOWN_CLUB_INTERNAL
+    return _normalize_club_label(value)
+
+
+# Only a handful of distinct club labels exist, so every MP row shares one interned string
+# per club (this also keeps pickled worker results small).
+@lru_cache(maxsize=1024)
+def _normalize_club_label(value: str) -> str:
     normalized = " ".join(value.split())
     if not normalized:
         return _UNKNOWN_CLUB_INTERNAL
     if normalized == _NO_CLUB_RAW:
         return _NO_CLUB_INTERNAL
-    return normalized
-
-
-_ABSENT_VOTE_CODES = {"0", "N"}
+    return sys.intern(normalized)
 
 
-def _invalid_club_vote_ids(df: pl.DataFrame) -> set[int]:
-    if df.is_empty():
-        return set()
-    summary = (
-        df.group_by("vote_id")
-        .agg(
-            any_real=(~pl.col("club").is_in([_NO_CLUB_INTERNAL, _UNKNOWN_CLUB_INTERNAL])).any()
-        )
-        .filter(pl.col("any_real") == False)  # noqa: E712
-    )
-    if summary.is_empty():
-        return set()
-    return set(summary.get_column("vote_id").to_list())
+_ABSENT_VOTE_CODES = ["0", "N"]
+_VOTED_CODES = ["Z", "P", "?"]
+_VOTE_CODES = {code: code for code in (*_VOTED_CODES, *_ABSENT_VOTE_CODES)}
 
 
 @dataclass(frozen=True)
@@ -185,18 +208,18 @@ class ProcessResult:
 
 def _write_jsonl(df: pl.DataFrame, path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        for row in df.to_dicts():
-            f.write(json.dumps(row, ensure_ascii=False, sort_keys=True))
-            f.write("\n")
+    # Keep keys sorted within each line, like the previous json.dumps(sort_keys=True) writer.
+    df.select(sorted(df.columns)).write_ndjson(path)
+
+
+def _write_parquet(df: pl.DataFrame, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    df.write_parquet(path, compression="zstd", statistics=True)
 
 
 def _write_json(path: Path, obj: object) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(
-        json.dumps(obj, ensure_ascii=False, sort_keys=True, indent=2) + "\n",
-        encoding="utf-8",
-    )
+    path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS) + b"\n")
 
 
 def _mp_votes_shard_path(out_dir: Path, *, term_id: int | None, meeting_nr: int | None) -> Path:
@@ -205,6 +228,25 @@ def _mp_votes_shard_path(out_dir: Path, *, term_id: int | None, meeting_nr: int
     return out_dir / "mp_votes" / f"term={term_part}" / f"meeting={meeting_part}.jsonl"
 
 
+def _mp_votes_partition(out_dir: Path, *, suffix: str) -> pl.PartitionBy:
+    base = out_dir / "mp_votes"
+
+    # PartitionBy joins the provided path onto its base, so it has to be relative to it;
+    # a relative out_dir would otherwise end up doubled.
+    def file_path(args: pl.FileProviderArgs) -> Path:
+        keys = args.partition_keys.row(0, named=True)
+        path = _mp_votes_shard_path(out_dir, term_id=keys["term_id"], meeting_nr=keys["meeting_nr"])
+        return path.relative_to(base).with_suffix(suffix)
+
+    # One file per (term, meeting): disable size-based splitting so shard paths stay unique.
+    return pl.PartitionBy(
+        base,
+        key=["term_id", "meeting_nr"],
+        file_path_provider=file_path,
+        approximate_bytes_per_file=None,
+    )
+
+
 def _write_mp_votes_shards(mp_votes_df: pl.DataFrame, out_dir: Path) -> None:
     root = out_dir / "mp_votes"
     if root.exists():
@@ -214,96 +256,157 @@ def _write_mp_votes_shards(mp_votes_df: pl.DataFrame, out_dir: Path) -> None:
     shards_index: list[dict[str, object]] = []
 
     if mp_votes_df.height:
-        partitions = mp_votes_df.partition_by(
-            ["term_id", "meeting_nr"],
-            maintain_order=True,
-            as_dict=True,
+        # Stream every shard straight to disk; both sinks and the per-shard row counts for
+        # index.json are collected together so they share one pass over the frame.
+        mp_votes_lf = mp_votes_df.lazy()
+        shards_lf = mp_votes_lf.with_columns(pl.col("club", "vote_code").cast(pl.Utf8)).select(
+            sorted(mp_votes_df.columns)
+        )
+        *_, shard_rows = pl.collect_all(
+            [
+                shards_lf.sink_ndjson(
+                    _mp_votes_partition(out_dir, suffix=".jsonl"), mkdir=True, lazy=True
+                ),
+                shards_lf.sink_parquet(
+                    _mp_votes_partition(out_dir, suffix=".parquet"),
+                    compression="zstd",
+                    statistics=True,
+                    mkdir=True,
+                    lazy=True,
+                ),
+                mp_votes_lf.group_by(["term_id", "meeting_nr"])
+                .len()
+                .sort(["term_id", "meeting_nr"], nulls_last=True),
+            ]
         )
 
-        for (term_id, meeting_nr), shard_df in sorted(partitions.items(), key=lambda kv: kv[0]):
+        for term_id, meeting_nr, rows in shard_rows.iter_rows():
             path = _mp_votes_shard_path(out_dir, term_id=term_id, meeting_nr=meeting_nr)
-            _write_jsonl(shard_df, path)
+            parquet_path = path.with_suffix(".parquet")
             shards_index.append(
                 {
                     "term_id": term_id,
                     "meeting_nr": meeting_nr,
                     "path": str(path.relative_to(out_dir)).replace("\\", "/"),
-                    "rows": shard_df.height,
+                    "rows": rows,
                     "bytes": path.stat().st_size,
+                    "parquet_path": str(parquet_path.relative_to(out_dir)).replace("\\", "/"),
+                    "parquet_bytes": parquet_path.stat().st_size,
                 }
             )
 
     _write_json(root / "index.json", {"shards": shards_index})
 
 
-def process_votes(raw_votes_dir: Path, out_dir: Path, *, schema_version: int = 1) -> ProcessResult:
-    vote_files = sorted(
-        p for p in raw_votes_dir.glob("*.json") if p.is_file() and p.name != ".gitkeep"
-    )
-
-    votes: list[dict[str, object]] = []
-    mp_votes: list[dict[str, object]] = []
-
-    for path in vote_files:
-        payload = json.loads(path.read_text(encoding="utf-8"))
-        if payload.get("kind") != "vote":
+def _parse_one_vote_file(
+    path: Path,
+) -> tuple[dict[str, object] | None, dict[str, list[object]]]:
+    payload = orjson.loads(path.read_bytes())
+    if payload.get("kind") != "vote":
+        return None, {}
+
+    summary = payload.get("summary") or {}
+    stats_by_key, stats_by_code = _stats_lookups(payload.get("stats") or {})
+
+    vote_id = int(payload["vote_id"])
+    term_id = int(payload["term_id"]) if payload.get("term_id") is not None else None
+    meeting_nr = int(payload["meeting_nr"]) if payload.get("meeting_nr") is not None else None
+
+    vote_number = _safe_int(summary.get("Číslo hlasovania"))
+    dt_local = parse_sk_datetime_to_local(summary.get("Dátum a čas"))
+    dt_local_iso = dt_local.isoformat() if dt_local else None
+    dt_utc_iso = dt_local.astimezone(UTC).isoformat() if dt_local else None
+
+    vote = {
+        "vote_id": vote_id,
+        "term_id": term_id,
+        "meeting_nr": meeting_nr,
+        "vote_number": vote_number,
+        "vote_datetime_local": dt_local_iso,
+        "vote_datetime_utc": dt_utc_iso,
+        "title": summary.get("Názov hlasovania") or payload.get("title_from_listing"),
+        "result": summary.get("Výsledok hlasovania"),
+        "cpt_id": payload.get("cpt_id"),
+        "present": stats_by_key.get(_PRESENT_KEY),
+        "voting": stats_by_key.get(_VOTING_KEY),
+        "for": stats_by_code.get("Z"),
+        "against": stats_by_code.get("P"),
+        "abstain": stats_by_code.get("?"),
+        "not_voting": stats_by_code.get("N"),
+        "absent": stats_by_code.get("0"),
+        "source_url": payload.get("source_url"),
+        "http_status": payload.get("http_status"),
+        "fetched_at_utc": payload.get("fetched_at_utc"),
+    }
+
+    mp_votes = payload.get("mp_votes") or []
+    n = len(mp_votes)
+    # Per-vote fields are the same for every MP row, so they are repeated rather than rebuilt.
+    mp_cols: dict[str, list[object]] = {
+        "vote_id": [vote_id] * n,
+        "term_id": [term_id] * n,
+        "meeting_nr": [meeting_nr] * n,
+        "vote_number": [vote_number] * n,
+        "vote_datetime_local": [dt_local_iso] * n,
+        "vote_datetime_utc": [dt_utc_iso] * n,
+        "mp_id": [mv.get("mp_id") for mv in mp_votes],
+        "mp_name": [mv.get("mp_name") for mv in mp_votes],
+        "club": [_normalize_club(mv.get("club")) for mv in mp_votes],
+        "vote_code": [
+            _VOTE_CODES.get(code, code) for code in (mv.get("vote_code") for mv in mp_votes)
+        ],
+    }
+
+    return vote, mp_cols
+
+
+# Below this many files the process pool start-up costs more than it saves.
+_PARALLEL_MIN_FILES = 64
+
+
+def _iter_parsed_vote_files(
+    vote_files: list[Path], *, workers: int | None
+) -> Iterator[tuple[dict[str, object] | None, dict[str, list[object]]]]:
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(vote_files) < _PARALLEL_MIN_FILES:
+        yield from map(_parse_one_vote_file, vote_files)
+        return
+
+    chunksize = max(32, len(vote_files) // (workers * 4))
+    # spawn (not fork): this process has already started Polars' thread pool.
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as executor:
+        yield from executor.map(_parse_one_vote_file, vote_files, chunksize=chunksize)
+
+
+def process_votes(
+    raw_votes_dir: Path,
+    out_dir: Path,
+    *,
+    schema_version: int = 1,
+    workers: int | None = None,
+) -> ProcessResult:
+    vote_files: list[Path] = []
+    if raw_votes_dir.is_dir():
+        # DirEntry.is_file() uses the file type cached from the directory read (no extra stat).
+        with os.scandir(raw_votes_dir) as entries:
+            vote_files = [
+                Path(e.path)
+                for e in sorted(entries, key=lambda e: e.name)
+                if e.name.endswith(".json") and e.name != ".gitkeep" and e.is_file()
+            ]
+
+    votes_cols: dict[str, list[object]] = {k: [] for k in _VOTES_SCHEMA_OVERRIDES}
+    mp_votes_cols: dict[str, list[object]] = {k: [] for k in _MP_VOTES_SCHEMA_OVERRIDES}
+
+    for vote, vote_mp_cols in _iter_parsed_vote_files(vote_files, workers=workers):
+        if vote is None:
             continue
-
-        summary = payload.get("summary") or {}
-        stats = payload.get("stats") or {}
-
-        vote_id = int(payload["vote_id"])
-        term_id = int(payload["term_id"]) if payload.get("term_id") is not None else None
-        meeting_nr = int(payload["meeting_nr"]) if payload.get("meeting_nr") is not None else None
-
-        vote_number = _safe_int(summary.get("Číslo hlasovania"))
-        dt_local = parse_sk_datetime_to_local(summary.get("Dátum a čas"))
-        dt_utc = dt_local.astimezone(UTC) if dt_local else None
-
-        votes.append(
-            {
-                "vote_id": vote_id,
-                "term_id": term_id,
-                "meeting_nr": meeting_nr,
-                "vote_number": vote_number,
-                "vote_datetime_local": dt_local.isoformat() if dt_local else None,
-                "vote_datetime_utc": dt_utc.isoformat() if dt_utc else None,
-                "title": summary.get("Názov hlasovania") or payload.get("title_from_listing"),
-                "result": summary.get("Výsledok hlasovania"),
-                "cpt_id": payload.get("cpt_id"),
-                "present": _stats_get(stats, "Prítomní"),
-                "voting": _stats_get(stats, "Hlasujúcich"),
-                "for": _stats_get_code(stats, "Z"),
-                "against": _stats_get_code(stats, "P"),
-                "abstain": _stats_get_code(stats, "?"),
-                "not_voting": _stats_get_code(stats, "N"),
-                "absent": _stats_get_code(stats, "0"),
-                "source_url": payload.get("source_url"),
-                "http_status": payload.get("http_status"),
-                "fetched_at_utc": payload.get("fetched_at_utc"),
-            }
-        )
-
-        for mv in payload.get("mp_votes") or []:
-            vote_code = mv.get("vote_code")
-            is_present = vote_code is not None and vote_code not in _ABSENT_VOTE_CODES
-            is_voted = vote_code in {"Z", "P", "?"}
-            mp_votes.append(
-                {
-                    "vote_id": vote_id,
-                    "term_id": term_id,
-                    "meeting_nr": meeting_nr,
-                    "vote_number": vote_number,
-                    "vote_datetime_local": dt_local.isoformat() if dt_local else None,
-                    "vote_datetime_utc": dt_utc.isoformat() if dt_utc else None,
-                    "mp_id": mv.get("mp_id"),
-                    "mp_name": mv.get("mp_name"),
-                    "club": _normalize_club(mv.get("club")),
-                    "vote_code": vote_code,
-                    "is_present": is_present,
-                    "is_voted": is_voted,
-                }
-            )
+        for k, v in vote.items():
+            votes_cols[k].append(v)
+        for k, col in vote_mp_cols.items():
+            mp_votes_cols[k].extend(col)
 
     out_dir.mkdir(parents=True, exist_ok=True)
 
@@ -317,45 +420,59 @@ def process_votes(raw_votes_dir: Path, out_dir: Path, *, schema_version: int = 1
     ):
         legacy.unlink(missing_ok=True)
 
-    votes_df = _df_from_records(votes, schema_overrides=_VOTES_SCHEMA_OVERRIDES).sort(
+    votes_df = pl.DataFrame(votes_cols, schema=_VOTES_SCHEMA_OVERRIDES).sort(
         ["vote_datetime_utc", "vote_id"]
     )
-    mp_votes_df = _df_from_records(mp_votes, schema_overrides=_MP_VOTES_SCHEMA_OVERRIDES).sort(
-        ["vote_datetime_utc", "vote_id", "mp_id"]
+    mp_votes_df = (
+        pl.DataFrame(mp_votes_cols, schema=_MP_VOTES_SCHEMA_OVERRIDES)
+        .with_columns(
+            is_present=pl.col("vote_code").is_not_null()
+            & ~pl.col("vote_code").is_in(_ABSENT_VOTE_CODES),
+            is_voted=pl.col("vote_code").is_in(_VOTED_CODES).fill_null(False),
+        )
+        .sort(["vote_datetime_utc", "vote_id", "mp_id"])
     )
 
     _write_jsonl(votes_df, out_dir / "votes.jsonl")
+    _write_parquet(votes_df, out_dir / "votes.parquet")
     _write_mp_votes_shards(mp_votes_df, out_dir)
 
     if mp_votes_df.height:
-        mp_summary = (
-            mp_votes_df.group_by(["term_id", "mp_id", "mp_name"])
+        mp_votes_lf = mp_votes_df.lazy()
+        # Count each (MP, vote_code) pair once, then spread the counts into per-code columns.
+        mp_code_counts = mp_votes_lf.group_by(["term_id", "mp_id", "mp_name", "vote_code"]).agg(
+            n=pl.len()
+        )
+        code = pl.col("vote_code")
+        mp_summary_plan = (
+            mp_code_counts.group_by(["term_id", "mp_id", "mp_name"])
             .agg(
-                total_votes=pl.len(),
-                present_count=pl.col("is_present").cast(pl.Int8).sum(),
-                voted_count=pl.col("is_voted").cast(pl.Int8).sum(),
-                absent_count=pl.col("vote_code").is_in(["0", "N"]).cast(pl.Int8).sum(),
-                not_voting_count=(pl.col("vote_code") == "N").cast(pl.Int8).sum(),
-                abstain_count=(pl.col("vote_code") == "?").cast(pl.Int8).sum(),
-                for_count=(pl.col("vote_code") == "Z").cast(pl.Int8).sum(),
-                against_count=(pl.col("vote_code") == "P").cast(pl.Int8).sum(),
+                total_votes=pl.col("n").sum(),
+                present_count=pl.col("n").filter(~code.is_in(_ABSENT_VOTE_CODES)).sum(),
+                absent_count=pl.col("n").filter(code.is_in(_ABSENT_VOTE_CODES)).sum(),
+                not_voting_count=pl.col("n").filter(code == "N").sum(),
+                abstain_count=pl.col("n").filter(code == "?").sum(),
+                for_count=pl.col("n").filter(code == "Z").sum(),
+                against_count=pl.col("n").filter(code == "P").sum(),
             )
             .with_columns(
-                participation_rate=(pl.col("present_count") / pl.col("total_votes")).round(6)
+                voted_count=pl.col("for_count") + pl.col("against_count") + pl.col("abstain_count"),
+                participation_rate=(pl.col("present_count") / pl.col("total_votes")).round(6),
             )
             .sort(["term_id", "participation_rate", "mp_id"])
         )
 
-        invalid_club_votes = _invalid_club_vote_ids(mp_votes_df)
-        club_votes_df = mp_votes_df
-        if invalid_club_votes:
-            club_votes_df = mp_votes_df.filter(~pl.col("vote_id").is_in(list(invalid_club_votes)))
-
-        club_summary = (
-            club_votes_df.group_by(["term_id", "club"])
+        club_summary_plan = (
+            # Skip votes where nobody has a real club (e.g. all MPs are "(no_club)"/"(unknown)").
+            mp_votes_lf.filter(
+                (~pl.col("club").is_in([_NO_CLUB_INTERNAL, _UNKNOWN_CLUB_INTERNAL]))
+                .any()
+                .over("vote_id")
+            )
+            .group_by(["term_id", "club"])
             .agg(
                 total_votes=pl.len(),
-                absent_count=pl.col("vote_code").is_in(["0", "N"]).cast(pl.Int8).sum(),
+                absent_count=pl.col("vote_code").is_in(["0", "N"]).sum(),
             )
             .with_columns(
                 # Club-level "attendance" should treat vote_code "0" (absent) and "N" (not voting)
@@ -368,6 +485,8 @@ def process_votes(raw_votes_dir: Path, out_dir: Path, *, schema_version: int = 1
             .sort(["term_id", "participation_rate", "club"])
         )
 
+        mp_summary, club_summary = pl.collect_all([mp_summary_plan, club_summary_plan])
+
         _write_jsonl(mp_summary, out_dir / "mp_attendance.jsonl")
         _write_jsonl(club_summary, out_dir / "club_attendance.jsonl")
     else:
@@ -412,9 +531,6 @@ def process_votes(raw_votes_dir: Path, out_dir: Path, *, schema_version: int = 1
         mp_votes_rows=mp_votes_df.height,
     )
 
-    (out_dir / "metadata.json").write_text(
-        json.dumps(result.as_dict(), ensure_ascii=False, indent=2, sort_keys=True) + "\n",
-        encoding="utf-8",
-    )
+    _write_json(out_dir / "metadata.json", result.as_dict())
 
     return result
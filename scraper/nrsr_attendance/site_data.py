@@ -1,13 +1,17 @@
 from __future__ import annotations
 
-import json
+import multiprocessing
+import os
 import re
 import unicodedata
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from datetime import timedelta
+from functools import lru_cache
 from pathlib import Path
 
+import orjson
 import polars as pl
 
 from .club_colors import club_colors_for_term
@@ -17,19 +21,28 @@ _RESERVED_CLUB_KEYS = {
     "(unknown)": "unknown",
 }
 
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
 
+
+# The same club labels come back for every term and variant, so slugs are computed once per build.
+@lru_cache(maxsize=4096)
 def slugify(value: str) -> str:
     normalized = unicodedata.normalize("NFKD", value)
     normalized = "".join(ch for ch in normalized if not unicodedata.combining(ch))
     normalized = normalized.casefold()
-    normalized = re.sub(r"[^a-z0-9]+", "-", normalized)
-    normalized = re.sub(r"-{2,}", "-", normalized).strip("-")
+    # The "+" already collapses runs, so a single substitution leaves no repeated dashes.
+    normalized = _NON_ALNUM_RE.sub("-", normalized).strip("-")
     return normalized or "unknown"
 
 
 def build_club_keys(clubs: list[str]) -> dict[str, str]:
+    # Copy so callers cannot mutate the cached mapping.
+    return dict(_club_keys(tuple(sorted({c for c in clubs if isinstance(c, str)}))))
+
+
+@lru_cache(maxsize=64)
+def _club_keys(labels: tuple[str, ...]) -> dict[str, str]:
     # Deterministic mapping: sort labels, then allocate slugs and resolve collisions with -2/-3...
-    labels = sorted({c for c in clubs if isinstance(c, str)})
     used: dict[str, int] = {}
     mapping: dict[str, str] = {}
 
@@ -50,17 +63,60 @@ def build_club_keys(clubs: list[str]) -> dict[str, str]:
     return mapping
 
 
-def _invalid_club_vote_ids(df: pl.DataFrame) -> set[int]:
+def _invalid_club_vote_ids(df: pl.DataFrame) -> pl.DataFrame:
     if df.is_empty():
-        return set()
-    summary = (
+        return pl.DataFrame(schema={"vote_id": pl.Int64})
+    return (
         df.group_by("vote_id")
         .agg(any_real=(~pl.col("club").is_in(["(no_club)", "(unknown)"])).any())
         .filter(pl.col("any_real") == False)  # noqa: E712
+        .select("vote_id")
     )
-    if summary.is_empty():
-        return set()
-    return set(summary.get_column("vote_id").to_list())
+
+
+def _drop_votes(df: pl.DataFrame, vote_ids: pl.DataFrame) -> pl.DataFrame:
+    # Hash anti join instead of is_in over a Python list; keeps the row order of df.
+    if df.is_empty() or vote_ids.is_empty():
+        return df
+    return df.join(vote_ids, on="vote_id", how="anti", maintain_order="left")
+
+
+# One 0/1 column per vote code, added once per term so every aggregation is a plain sum.
+_VOTE_CODE_FLAGS = {
+    "Z": "is_for",
+    "P": "is_against",
+    "?": "is_abstain",
+    "N": "is_not_voting",
+    "0": "is_away",
+}
+
+
+def _prepare_mp_votes(df: pl.DataFrame) -> pl.DataFrame:
+    if df.is_empty():
+        return df
+    # Both columns hold a handful of distinct labels; as categoricals, comparisons, joins and
+    # group_bys work on integer codes. Categorical (not Enum) so an unexpected code still loads.
+    df = df.with_columns(pl.col("vote_code", "club").cast(pl.Categorical))
+    # Chronological order (undated rows last, as the latest) lets "current club" be a plain
+    # per-MP last() instead of a sort per aggregation.
+    df = df.sort(["vote_datetime_utc", "vote_id"], nulls_last=True, maintain_order=True)
+    return df.with_columns(
+        (pl.col("vote_code") == code).cast(pl.Int8).alias(flag)
+        for code, flag in _VOTE_CODE_FLAGS.items()
+    )
+
+
+def _count_codes(codes: list[str]) -> pl.Expr:
+    return pl.sum_horizontal(_VOTE_CODE_FLAGS[code] for code in codes).sum()
+
+
+def _is_known_club(club_col: str) -> pl.Expr:
+    return pl.col("mp_id").is_not_null() & pl.col(club_col).is_not_null() & (pl.col(club_col) != "")
+
+
+def _current_clubs(lf: pl.LazyFrame) -> pl.LazyFrame:
+    # Latest club per MP: (mp_id, club). Expects rows in _prepare_mp_votes order.
+    return lf.group_by("mp_id").agg(pl.col("club").last()).filter(_is_known_club("club"))
 
 
 @dataclass(frozen=True)
@@ -93,12 +149,13 @@ def build_site_data(
     include_mp_pages: bool = False,
     include_vote_pages: bool = False,
     recent_votes_per_mp: int = 20,
+    workers: int | None = None,
 ) -> None:
     metadata_path = processed_dir / "metadata.json"
     if not metadata_path.exists():
         raise FileNotFoundError(f"Missing processed metadata: {metadata_path}")
 
-    metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
+    metadata = orjson.loads(metadata_path.read_bytes())
     last_updated_utc = metadata.get("last_updated_utc")
     schema_version = int(metadata.get("schema_version") or 1)
 
@@ -113,24 +170,28 @@ def build_site_data(
     if not votes_path.exists():
         raise FileNotFoundError(f"Missing processed votes: {votes_path}")
 
-    mps_df = pl.read_ndjson(mp_attendance_path)
-    clubs_df = pl.read_ndjson(club_attendance_path)
-    votes_df = pl.read_ndjson(
-        votes_path,
-        schema_overrides={
-            "vote_id": pl.Int64,
-            "term_id": pl.Int64,
-            "meeting_nr": pl.Int64,
-            "vote_number": pl.Int64,
-            "vote_datetime_local": pl.Utf8,
-            "vote_datetime_utc": pl.Utf8,
-            "title": pl.Utf8,
-            "result": pl.Utf8,
-        },
+    # Scan only the columns the site uses and collect the three inputs together.
+    mp_terms_df, clubs_df, votes_df = pl.collect_all(
+        [
+            pl.scan_ndjson(mp_attendance_path).select("term_id").unique(),
+            pl.scan_ndjson(club_attendance_path).select(["term_id", "club"]),
+            _scan_votes(votes_path).select(
+                [
+                    "term_id",
+                    "vote_id",
+                    "vote_datetime_local",
+                    "vote_datetime_utc",
+                    "meeting_nr",
+                    "vote_number",
+                    "title",
+                    "result",
+                ]
+            ),
+        ]
     )
 
     discovered_terms = sorted(
-        {int(t) for t in mps_df.get_column("term_id").unique().to_list() if t is not None},
+        {int(t) for t in mp_terms_df.get_column("term_id").to_list() if t is not None},
         reverse=True,
     )
     if terms is None:
@@ -152,409 +213,472 @@ def build_site_data(
 
     _write_json(out_assets_data_dir / "manifest.json", manifest)
 
+    # Split once instead of re-scanning the full frames for every term.
+    votes_by_term = votes_df.partition_by("term_id", as_dict=True)
+    clubs_by_term = clubs_df.partition_by("term_id", as_dict=True)
+
     generated_at_utc = datetime.now(UTC).isoformat()
-    for term_id in terms:
-        term_votes_df = (
-            votes_df.filter(pl.col("term_id") == term_id)
-            .sort(["vote_datetime_utc", "vote_id"], descending=[True, True])
-            .select(
-                [
-                    "vote_id",
-                    "vote_datetime_local",
-                    "vote_datetime_utc",
-                    "meeting_nr",
-                    "vote_number",
-                    "title",
-                    "result",
-                ]
+    term_jobs = [
+        (
+            term_id,
+            {
+                "processed_dir": processed_dir,
+                "out_assets_data_dir": out_assets_data_dir,
+                "votes_df": votes_by_term.get((term_id,), votes_df.clear()),
+                "clubs_df": clubs_by_term.get((term_id,), clubs_df.clear()),
+                "generated_at_utc": generated_at_utc,
+                "include_mp_pages": include_mp_pages,
+                "include_vote_pages": include_vote_pages,
+                "recent_votes_per_mp": recent_votes_per_mp,
+            },
+        )
+        for term_id in terms
+    ]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(term_jobs))
+    if workers <= 1:
+        for term_id, kwargs in term_jobs:
+            _build_term(term_id, **kwargs)
+        return
+
+    # Terms are independent; spawn (not fork) so workers do not inherit Polars' thread pool.
+    # Spawned workers start from a fresh interpreter, so the caller's engine affinity is
+    # handed to them explicitly and every term runs on the same engine as workers=1 would.
+    ctx = multiprocessing.get_context("spawn")
+    engine_affinity = pl.Config.state(if_set=True).get("POLARS_ENGINE_AFFINITY")
+    # Each worker would otherwise start one Polars thread per core; split the cores between
+    # them instead. Workers read POLARS_MAX_THREADS from the environment they are spawned with.
+    worker_threads = str(max(1, (os.cpu_count() or 1) // workers))
+    prev_max_threads = os.environ.get("POLARS_MAX_THREADS")
+    if prev_max_threads is None:
+        os.environ["POLARS_MAX_THREADS"] = worker_threads
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=ctx,
+            initializer=_init_term_worker,
+            initargs=(engine_affinity,),
+        ) as executor:
+            futures = [
+                executor.submit(_build_term, term_id, **kwargs) for term_id, kwargs in term_jobs
+            ]
+            for future in futures:
+                future.result()
+    finally:
+        if prev_max_threads is None:
+            os.environ.pop("POLARS_MAX_THREADS", None)
+
+
+def _init_term_worker(engine_affinity: str | None) -> None:
+    pl.Config.set_engine_affinity(engine_affinity)
+
+
+def _build_term(
+    term_id: int,
+    *,
+    processed_dir: Path,
+    out_assets_data_dir: Path,
+    votes_df: pl.DataFrame,
+    clubs_df: pl.DataFrame,
+    generated_at_utc: str,
+    include_mp_pages: bool,
+    include_vote_pages: bool,
+    recent_votes_per_mp: int,
+) -> None:
+    term_votes_df = votes_df.sort(["vote_datetime_utc", "vote_id"], descending=[True, True]).select(
+        [
+            "vote_id",
+            "vote_datetime_local",
+            "vote_datetime_utc",
+            "meeting_nr",
+            "vote_number",
+            "title",
+            "result",
+        ]
+    )
+
+    term_mp_votes_df = _prepare_mp_votes(_load_mp_votes_for_term(processed_dir, term_id))
+
+    # Rolling window: last 180 days anchored at the latest vote in this term (deterministic).
+    to_utc = None
+    from_utc = None
+    if not term_votes_df.is_empty():
+        latest = term_votes_df.item(0, "vote_datetime_utc")
+        if isinstance(latest, str) and latest:
+            to_utc = datetime.fromisoformat(latest)
+            from_utc = to_utc - timedelta(days=180)
+
+    window_full = {"kind": "full"}
+
+    votes_in_window = 0
+    from_str: str | None = None
+    window_meta = {
+        "kind": "rolling",
+        "days": 180,
+        "from_utc": None,
+        "to_utc": None,
+        "votes_in_window": 0,
+    }
+    if not term_mp_votes_df.is_empty():
+        # The window test is evaluated once into a column; the window frames, the "w_" counts
+        # and the club breakdowns all read it instead of re-comparing timestamps.
+        in_window = pl.lit(False)
+        if to_utc and from_utc:
+            from_str = from_utc.isoformat()
+            in_window = (pl.col("vote_datetime_utc") >= from_str).fill_null(False)
+            votes_in_window = int(
+                term_votes_df.select((pl.col("vote_datetime_utc") >= from_str).sum()).item()
             )
+            window_meta = {
+                "kind": "rolling",
+                "days": 180,
+                "from_utc": from_str,
+                "to_utc": to_utc.isoformat(),
+                "votes_in_window": votes_in_window,
+            }
+        term_mp_votes_df = term_mp_votes_df.with_columns(in_window=in_window)
+
+    # Votes where nobody had a real club are left out of every club breakdown; filtered once
+    # here and reused for the window and the pages.
+    club_votes_df = _drop_votes(term_mp_votes_df, _invalid_club_vote_ids(term_mp_votes_df))
+    window_mp_votes_df = pl.DataFrame()
+    window_club_votes_df = pl.DataFrame()
+    if from_str is not None:
+        window_mp_votes_df = term_mp_votes_df.filter(pl.col("in_window"))
+        window_club_votes_df = club_votes_df.filter(pl.col("in_window"))
+    primary_clubs_df = pl.DataFrame(schema={"mp_id": pl.Int64, "primary_club": pl.Utf8})
+    term_current_clubs_df = pl.DataFrame(schema={"mp_id": pl.Int64, "term_current_club": pl.Utf8})
+    if not club_votes_df.is_empty():
+        slim = club_votes_df.select(["mp_id", "club", "vote_datetime_utc", "vote_id"])
+
+        # Most frequent club per MP; ties go to the smallest label (compared as text, since
+        # club is categorical here).
+        primary_clubs_df = (
+            slim.group_by(["mp_id", "club"])
+            .agg(n=pl.len())
+            .sort(
+                [pl.col("mp_id"), pl.col("n"), pl.col("club").cast(pl.Utf8)],
+                descending=[False, True, False],
+            )
+            .group_by("mp_id", maintain_order=True)
+            .agg(primary_club=pl.first("club"))
+            .filter(_is_known_club("primary_club"))
+        )
+        term_current_clubs_df = (
+            slim.group_by("mp_id")
+            .agg(term_current_club=pl.col("club").last())
+            .filter(_is_known_club("term_current_club"))
         )
 
-        term_mp_votes_df = _load_mp_votes_for_term(processed_dir, term_id)
-        invalid_club_vote_ids = _invalid_club_vote_ids(term_mp_votes_df)
-        club_votes_df = term_mp_votes_df
-        if invalid_club_vote_ids:
-            club_votes_df = term_mp_votes_df.filter(
-                ~pl.col("vote_id").is_in(list(invalid_club_vote_ids))
+    # Stable club keys are derived from all clubs seen in the full-term data.
+    club_labels: list[str] = clubs_df.get_column("club").drop_nulls().unique().sort().to_list()
+    club_key_map = build_club_keys(club_labels)
+    club_color_map = club_colors_for_term(term_id)
+
+    # Every label the term can produce gets its key once; labels outside the term's club list
+    # fall back to a plain slug. Everything downstream maps through this dict.
+    term_club_labels = {"(unknown)", *club_key_map}
+    if "club" in term_mp_votes_df.columns:
+        term_club_labels.update(term_mp_votes_df.get_column("club").drop_nulls().unique())
+    club_keys = {club: club_key_map.get(club, slugify(club)) for club in term_club_labels}
+
+    def attach_clubs(lf: pl.LazyFrame, *, current_lf: pl.LazyFrame) -> pl.LazyFrame:
+        return (
+            lf.join(primary_clubs_df.lazy(), on="mp_id", how="left", maintain_order="left")
+            .join(term_current_clubs_df.lazy(), on="mp_id", how="left", maintain_order="left")
+            .join(
+                current_lf.rename({"club": "window_current_club"}),
+                on="mp_id",
+                how="left",
+                maintain_order="left",
             )
-        mp_primary_club_by_id: dict[int, str] = {}
-        mp_current_club_by_id: dict[int, str] = {}
-        if not club_votes_df.is_empty():
-            slim = club_votes_df.select(["mp_id", "club", "vote_datetime_utc", "vote_id"])
-
-            primary_clubs = (
-                slim.group_by(["mp_id", "club"], maintain_order=True)
-                .agg(n=pl.len())
-                .sort(["mp_id", "n", "club"], descending=[False, True, False])
-                .group_by("mp_id", maintain_order=True)
-                .agg(pl.first("club").alias("club"))
-                .to_dicts()
+            .with_columns(pl.col("primary_club").fill_null("(unknown)"))
+            .with_columns(
+                current_club=pl.coalesce("window_current_club", "term_current_club", "primary_club")
             )
-            for row in primary_clubs:
-                mp_id = row.get("mp_id")
-                club = row.get("club")
-                if isinstance(mp_id, int) and isinstance(club, str) and club:
-                    mp_primary_club_by_id[mp_id] = club
-
-            current_clubs = (
-                slim.sort(
-                    ["mp_id", "vote_datetime_utc", "vote_id"],
-                    descending=[False, True, True],
-                )
-                .group_by("mp_id", maintain_order=True)
-                .agg(pl.first("club").alias("club"))
-                .to_dicts()
+            .drop(["window_current_club", "term_current_club"])
+            .with_columns(
+                primary_club_key=pl.col("primary_club").replace_strict(club_keys),
+                current_club_key=pl.col("current_club").replace_strict(club_keys),
+            )
+            # For leaderboards/filtering, use the club "as of now" (latest known vote).
+            .with_columns(
+                club=pl.col("current_club"),
+                club_key=pl.col("current_club_key"),
+                club_color=pl.col("current_club").replace_strict(
+                    club_color_map, default=None, return_dtype=pl.Utf8
+                ),
             )
-            for row in current_clubs:
-                mp_id = row.get("mp_id")
-                club = row.get("club")
-                if isinstance(mp_id, int) and isinstance(club, str) and club:
-                    mp_current_club_by_id[mp_id] = club
-
-        # Stable club keys are derived from all clubs seen in the full-term data.
-        full_term_clubs = (
-            clubs_df.filter(pl.col("term_id") == term_id).select("club").unique().to_dicts()
         )
-        club_labels = [row.get("club") for row in full_term_clubs]
-        club_key_map = build_club_keys([c for c in club_labels if isinstance(c, str)])
-        club_color_map = club_colors_for_term(term_id)
-
-        def resolve_club_color(club: object) -> str | None:
-            if not isinstance(club, str):
-                return None
-            return club_color_map.get(club)
-
-        def attach_clubs(
-            rows: list[dict[str, object]],
-            *,
-            current_by_id: dict[int, str],
-        ) -> list[dict[str, object]]:
-            out: list[dict[str, object]] = []
-            for mp in rows:
-                mp_id = mp.get("mp_id")
-                if not isinstance(mp_id, int):
-                    mp["club"] = "(unknown)"
-                    mp["club_key"] = "unknown"
-                    mp["primary_club"] = "(unknown)"
-                    mp["primary_club_key"] = "unknown"
-                    mp["current_club"] = "(unknown)"
-                    mp["current_club_key"] = "unknown"
-                    out.append(mp)
-                    continue
-
-                primary_club = mp_primary_club_by_id.get(mp_id) or "(unknown)"
-                current_club = (
-                    current_by_id.get(mp_id)
-                    or mp_current_club_by_id.get(mp_id)
-                    or primary_club
-                    or "(unknown)"
-                )
-
-                mp["primary_club"] = primary_club
-                mp["primary_club_key"] = club_key_map.get(primary_club, slugify(primary_club))
-                mp["current_club"] = current_club
-                mp["current_club_key"] = club_key_map.get(current_club, slugify(current_club))
-
-                # For leaderboards/filtering, use the club "as of now" (latest known vote).
-                mp["club"] = current_club
-                mp["club_key"] = mp["current_club_key"]
-                mp["club_color"] = resolve_club_color(mp["club"])
-                out.append(mp)
-            return out
-
-        def clubs_from_mps(rows: list[dict[str, object]]) -> list[dict[str, object]]:
-            df = pl.DataFrame(rows)
-            if df.is_empty():
-                return []
-            needed = {"club", "club_key", "term_id", "present_count", "absent_count", "total_votes", "voted_count"}
-            for col in needed:
-                if col not in df.columns:
-                    df = df.with_columns(pl.lit(None).alias(col))
-            clubs = (
-                df.group_by(["club", "club_key"], maintain_order=True)
-                .agg(
-                    term_id=pl.lit(term_id),
-                    total_votes=pl.col("total_votes").cast(pl.Int64).sum(),
-                    present_count=pl.col("present_count").cast(pl.Int64).sum(),
-                    absent_count=pl.col("absent_count").cast(pl.Int64).sum(),
-                    voted_count=pl.col("voted_count").cast(pl.Int64).sum(),
-                )
-                .with_columns(
-                    participation_rate=(pl.col("present_count") / pl.col("total_votes")).round(6)
-                )
-                .sort(["participation_rate", "club"], descending=[True, False])
-                .to_dicts()
+
+    def clubs_from_mps(mps_lf: pl.LazyFrame) -> pl.LazyFrame:
+        # club_key and club_color come along from attach_clubs as part of the group key.
+        return (
+            mps_lf.group_by(["club", "club_key", "club_color"])
+            .agg(
+                term_id=pl.lit(term_id),
+                total_votes=pl.col("total_votes").sum(),
+                present_count=pl.col("present_count").sum(),
+                absent_count=pl.col("absent_count").sum(),
+                voted_count=pl.col("voted_count").sum(),
             )
-            for row in clubs:
-                row["club_color"] = resolve_club_color(row.get("club"))
-            return clubs
-
-        full_club_rows: list[dict[str, object]] = []
-        for label in sorted({c for c in club_labels if isinstance(c, str)}):
-            full_club_rows.append(
-                {
-                    "club": label,
-                    "club_key": club_key_map.get(label, slugify(label)),
-                    "club_color": resolve_club_color(label),
-                }
+            .with_columns(
+                participation_rate=(pl.col("present_count") / pl.col("total_votes")).round(6),
             )
+        )
 
-        def fill_missing_clubs(clubs_rows: list[dict[str, object]]) -> list[dict[str, object]]:
-            seen = {r.get("club_key") for r in clubs_rows}
-            out = list(clubs_rows)
-            for base in full_club_rows:
-                key = base.get("club_key")
-                if key in seen:
-                    continue
-                out.append(
-                    {
-                        "term_id": term_id,
-                        "club": base.get("club"),
-                        "club_key": key,
-                        "club_color": base.get("club_color"),
-                        "total_votes": 0,
-                        "present_count": 0,
-                        "absent_count": 0,
-                        "voted_count": 0,
-                        "participation_rate": None,
-                    }
-                )
-            out.sort(
-                key=lambda r: (
-                    -(r.get("participation_rate") or -1),
-                    str(r.get("club") or ""),
-                )
-            )
-            return out
-
-        def current_club_for_votes(df: pl.DataFrame) -> dict[int, str]:
-            if df.is_empty():
-                return {}
-            cur = (
-                df.select(["mp_id", "club", "vote_datetime_utc", "vote_id"])
-                .sort(
-                    ["mp_id", "vote_datetime_utc", "vote_id"],
-                    descending=[False, True, True],
-                )
-                .group_by("mp_id", maintain_order=True)
-                .agg(pl.first("club").alias("club"))
-                .to_dicts()
+    full_clubs_lf = pl.LazyFrame(
+        {
+            "club": club_labels,
+            "club_key": [club_keys[label] for label in club_labels],
+            "club_color": [club_color_map.get(label) for label in club_labels],
+        },
+        schema={"club": pl.Utf8, "club_key": pl.Utf8, "club_color": pl.Utf8},
+    ).with_columns(
+        term_id=pl.lit(term_id),
+        total_votes=pl.lit(0),
+        present_count=pl.lit(0),
+        absent_count=pl.lit(0),
+        voted_count=pl.lit(0),
+        participation_rate=pl.lit(None, dtype=pl.Float64),
+    )
+
+    def fill_missing_clubs(clubs_lf: pl.LazyFrame) -> pl.LazyFrame:
+        # Every club of the term gets a row (zeros when it has no votes in this variant).
+        # Best rate first; a zero rate ranks with the empty rows, then by label.
+        missing_lf = full_clubs_lf.join(clubs_lf.select("club_key"), on="club_key", how="anti")
+        return pl.concat([clubs_lf, missing_lf], how="diagonal_relaxed").sort(
+            [pl.col("participation_rate").fill_null(0.0), "club"],
+            descending=[True, False],
+            maintain_order=True,
+        )
+
+    def plan_counts(df: pl.DataFrame) -> pl.LazyFrame:
+        # Per-MP code counts for the full term plus "w_"-prefixed counts for the rolling
+        # window, so all four variants come out of a single group_by.
+        flags = list(_VOTE_CODE_FLAGS.values())
+        return (
+            df.lazy()
+            .with_columns(pl.col("in_window").cast(pl.Int8))
+            .group_by(["mp_id", "mp_name"])
+            .agg(
+                total_votes=pl.len(),
+                w_total_votes=pl.col("in_window").sum(),
+                *(pl.col(flag).sum() for flag in flags),
+                *((pl.col(flag) * pl.col("in_window")).sum().alias(f"w_{flag}") for flag in flags),
             )
-            out: dict[int, str] = {}
-            for row in cur:
-                mp_id = row.get("mp_id")
-                club = row.get("club")
-                if isinstance(mp_id, int) and isinstance(club, str) and club:
-                    out[mp_id] = club
-            return out
-
-        def mps_from_votes(
-            df: pl.DataFrame,
-            *,
-            absent_codes: list[str],
-            current_by_id: dict[int, str],
-        ) -> list[dict[str, object]]:
-            if df.is_empty():
-                return []
-            agg = (
-                df.group_by(["mp_id", "mp_name"], maintain_order=True)
-                .agg(
-                    term_id=pl.lit(term_id),
-                    total_votes=pl.len(),
-                    absent_count=pl.col("vote_code").is_in(absent_codes).cast(pl.Int64).sum(),
-                    voted_count=pl.col("vote_code").is_in(["Z", "P", "?"]).cast(pl.Int64).sum(),
-                    for_count=(pl.col("vote_code") == "Z").cast(pl.Int64).sum(),
-                    against_count=(pl.col("vote_code") == "P").cast(pl.Int64).sum(),
-                    abstain_count=(pl.col("vote_code") == "?").cast(pl.Int64).sum(),
-                    not_voting_count=(pl.col("vote_code") == "N").cast(pl.Int64).sum(),
-                )
-                .with_columns(present_count=(pl.col("total_votes") - pl.col("absent_count")))
-                .with_columns(
-                    participation_rate=(pl.col("present_count") / pl.col("total_votes")).round(6)
-                )
-                .sort(["participation_rate", "mp_id"], descending=[True, False])
-                .to_dicts()
+        )
+
+    def plan_variant(
+        counts_lf: pl.LazyFrame,
+        *,
+        absent_codes: list[str],
+        window: bool,
+        current_lf: pl.LazyFrame,
+    ) -> tuple[pl.LazyFrame, pl.LazyFrame]:
+        # (mps, clubs) plans; collected together for all variants of the term.
+        prefix = "w_" if window else ""
+
+        def count(*codes: str) -> pl.Expr:
+            return pl.sum_horizontal(prefix + _VOTE_CODE_FLAGS[code] for code in codes)
+
+        if window:
+            counts_lf = counts_lf.filter(pl.col("w_total_votes") > 0)
+        mps_lf = attach_clubs(
+            counts_lf.select(
+                "mp_id",
+                "mp_name",
+                term_id=pl.lit(term_id),
+                total_votes=pl.col(prefix + "total_votes"),
+                absent_count=count(*absent_codes),
+                voted_count=count("Z", "P", "?"),
+                for_count=count("Z"),
+                against_count=count("P"),
+                abstain_count=count("?"),
+                not_voting_count=count("N"),
             )
-            return attach_clubs([dict(row) for row in agg], current_by_id=current_by_id)
-
-        def _filter_invalid_club_votes(df: pl.DataFrame) -> pl.DataFrame:
-            if df.is_empty() or not invalid_club_vote_ids:
-                return df
-            return df.filter(~pl.col("vote_id").is_in(list(invalid_club_vote_ids)))
-
-        def build_variant(
-            *,
-            mp_votes_df: pl.DataFrame,
-            window: dict[str, object],
-            absent_codes: list[str],
-            absence_kind: str,
-        ) -> TermOverview:
-            current_by_id = current_club_for_votes(_filter_invalid_club_votes(mp_votes_df))
-            mps_rows = mps_from_votes(
-                mp_votes_df,
-                absent_codes=absent_codes,
-                current_by_id=current_by_id,
+            .with_columns(present_count=(pl.col("total_votes") - pl.col("absent_count")))
+            .with_columns(
+                participation_rate=(pl.col("present_count") / pl.col("total_votes")).round(6)
             )
-            clubs_rows = fill_missing_clubs(clubs_from_mps(mps_rows))
-            return TermOverview(
-                term_id=term_id,
-                generated_at_utc=generated_at_utc,
-                window=window,
-                absence={"kind": absence_kind, "absent_codes": absent_codes},
-                club_attribution="current",
-                mps=mps_rows,
-                clubs=clubs_rows,
+            .sort(["participation_rate", "mp_id", "mp_name"], descending=[True, False, False]),
+            current_lf=current_lf,
+        )
+        return mps_lf, fill_missing_clubs(clubs_from_mps(mps_lf))
+
+    # absence variants
+    abs0n = ["0", "N"]
+    abs0 = ["0"]
+
+    variants = [
+        (False, window_full, abs0n, "abs0n"),
+        (False, window_full, abs0, "abs0"),
+        (True, window_meta, abs0n, "abs0n"),
+        (True, window_meta, abs0, "abs0"),
+    ]
+    plans: list[tuple[pl.LazyFrame, pl.LazyFrame]] = []
+    if term_mp_votes_df.is_empty():
+        no_clubs_lf = fill_missing_clubs(pl.LazyFrame(schema={"club_key": pl.Utf8}))
+        plans = [(pl.LazyFrame(), no_clubs_lf) for _ in variants]
+    else:
+        counts_lf = plan_counts(term_mp_votes_df)
+        full_current_lf = _current_clubs(club_votes_df.lazy())
+        window_current_lf = full_current_lf.clear()
+        if not window_mp_votes_df.is_empty():
+            window_current_lf = _current_clubs(window_club_votes_df.lazy())
+        plans = [
+            plan_variant(
+                counts_lf,
+                absent_codes=codes,
+                window=in_window,
+                current_lf=window_current_lf if in_window else full_current_lf,
             )
+            for in_window, _, codes, _ in variants
+        ]
+    frames = pl.collect_all([lf for plan in plans for lf in plan])
+    overview_full_abs0n, overview_full_abs0, overview_180_abs0n, overview_180_abs0 = (
+        TermOverview(
+            term_id=term_id,
+            generated_at_utc=generated_at_utc,
+            window=window,
+            absence={"kind": absence_kind, "absent_codes": codes},
+            club_attribution="current",
+            mps=mps_df.to_dicts(),
+            clubs=clubs_df.to_dicts(),
+        )
+        for (_, window, codes, absence_kind), mps_df, clubs_df in zip(
+            variants, frames[::2], frames[1::2], strict=True
+        )
+    )
 
-        # Rolling window: last 180 days anchored at the latest vote in this term (deterministic).
-        to_utc = None
-        from_utc = None
-        if not term_votes_df.is_empty():
-            latest = term_votes_df.select("vote_datetime_utc").to_dicts()[0].get("vote_datetime_utc")
-            if isinstance(latest, str) and latest:
-                to_utc = datetime.fromisoformat(latest)
-                from_utc = to_utc - timedelta(days=180)
-
-        window_full = {"kind": "full"}
-
-        votes_in_window = 0
-        window_mp_votes_df = pl.DataFrame()
-        window_meta = {"kind": "rolling", "days": 180, "from_utc": None, "to_utc": None, "votes_in_window": 0}
-        if to_utc and from_utc and not term_mp_votes_df.is_empty():
-            from_str = from_utc.isoformat()
-            window_votes_df = term_votes_df.filter(pl.col("vote_datetime_utc") >= from_str)
-            votes_in_window = int(window_votes_df.height)
-            window_mp_votes_df = term_mp_votes_df.filter(pl.col("vote_datetime_utc") >= from_str)
-            window_meta = {
-                "kind": "rolling",
-                "days": 180,
-                "from_utc": from_utc.isoformat(),
-                "to_utc": to_utc.isoformat(),
-                "votes_in_window": votes_in_window,
-            }
+    out_term = out_assets_data_dir / "term" / str(term_id)
+    # Encoded via as_dict(): orjson ignores OPT_SORT_KEYS for dataclass fields.
+    full_abs0n_json = _encode_json(overview_full_abs0n.as_dict())
+    full_abs0_json = _encode_json(overview_full_abs0.as_dict())
+    window_abs0n_json = _encode_json(overview_180_abs0n.as_dict())
+    window_abs0_json = _encode_json(overview_180_abs0.as_dict())
+    _write_bytes(out_term / "overview.full.abs0n.json", full_abs0n_json)
+    _write_bytes(out_term / "overview.full.abs0.json", full_abs0_json)
+    _write_bytes(out_term / "overview.180d.abs0n.json", window_abs0n_json)
+    _write_bytes(out_term / "overview.180d.abs0.json", window_abs0_json)
+
+    # Back-compat (default = full term, abs0n); same bytes, encoded once.
+    _write_bytes(out_term / "overview.full.json", full_abs0n_json)
+    _write_bytes(out_term / "overview.180d.json", window_abs0n_json)
+    _write_bytes(out_term / "overview.json", full_abs0n_json)
+
+    _write_json(
+        out_assets_data_dir / "term" / str(term_id) / "votes.json",
+        term_votes_df.to_dicts(),
+    )
 
-        # absence variants
-        abs0n = ["0", "N"]
-        abs0 = ["0"]
+    if not (include_mp_pages or include_vote_pages):
+        return
 
-        overview_full_abs0n = build_variant(
+    if include_mp_pages:
+        mp_root = out_assets_data_dir / "term" / str(term_id) / "mp"
+        _write_mp_pages(
+            mp_root / "full.abs0n",
+            term_id=term_id,
+            mp_rows=overview_full_abs0n.mps,
             mp_votes_df=term_mp_votes_df,
-            window=window_full,
-            absent_codes=abs0n,
-            absence_kind="abs0n",
+            club_votes_df=club_votes_df,
+            votes_df=term_votes_df,
+            club_color_map=club_color_map,
+            recent_votes_per_mp=recent_votes_per_mp,
         )
-        overview_full_abs0 = build_variant(
+        _write_mp_pages(
+            mp_root / "full.abs0",
+            term_id=term_id,
+            mp_rows=overview_full_abs0.mps,
             mp_votes_df=term_mp_votes_df,
-            window=window_full,
-            absent_codes=abs0,
-            absence_kind="abs0",
+            club_votes_df=club_votes_df,
+            votes_df=term_votes_df,
+            club_color_map=club_color_map,
+            recent_votes_per_mp=recent_votes_per_mp,
         )
-        overview_180_abs0n = build_variant(
+        _write_mp_pages(
+            mp_root / "180d.abs0n",
+            term_id=term_id,
+            mp_rows=overview_180_abs0n.mps,
             mp_votes_df=window_mp_votes_df,
-            window=window_meta,
-            absent_codes=abs0n,
-            absence_kind="abs0n",
+            club_votes_df=window_club_votes_df,
+            votes_df=term_votes_df,
+            club_color_map=club_color_map,
+            recent_votes_per_mp=recent_votes_per_mp,
         )
-        overview_180_abs0 = build_variant(
+        _write_mp_pages(
+            mp_root / "180d.abs0",
+            term_id=term_id,
+            mp_rows=overview_180_abs0.mps,
             mp_votes_df=window_mp_votes_df,
-            window=window_meta,
-            absent_codes=abs0,
-            absence_kind="abs0",
+            club_votes_df=window_club_votes_df,
+            votes_df=term_votes_df,
+            club_color_map=club_color_map,
+            recent_votes_per_mp=recent_votes_per_mp,
+        )
+        # Back-compat default.
+        _write_mp_pages(
+            mp_root,
+            term_id=term_id,
+            mp_rows=overview_full_abs0n.mps,
+            mp_votes_df=term_mp_votes_df,
+            club_votes_df=club_votes_df,
+            votes_df=term_votes_df,
+            club_color_map=club_color_map,
+            recent_votes_per_mp=recent_votes_per_mp,
         )
 
-        out_term = out_assets_data_dir / "term" / str(term_id)
-        _write_json(out_term / "overview.full.abs0n.json", overview_full_abs0n.as_dict())
-        _write_json(out_term / "overview.full.abs0.json", overview_full_abs0.as_dict())
-        _write_json(out_term / "overview.180d.abs0n.json", overview_180_abs0n.as_dict())
-        _write_json(out_term / "overview.180d.abs0.json", overview_180_abs0.as_dict())
+    if include_vote_pages:
+        _write_vote_pages(
+            out_assets_data_dir / "term" / str(term_id) / "vote",
+            term_id=term_id,
+            votes_df=term_votes_df,
+            mp_votes_df=term_mp_votes_df,
+            club_votes_df=club_votes_df,
+            club_color_map=club_color_map,
+        )
 
-        # Back-compat (default = full term, abs0n).
-        _write_json(out_term / "overview.full.json", overview_full_abs0n.as_dict())
-        _write_json(out_term / "overview.180d.json", overview_180_abs0n.as_dict())
-        _write_json(out_term / "overview.json", overview_full_abs0n.as_dict())
 
-        _write_json(
-            out_assets_data_dir / "term" / str(term_id) / "votes.json",
-            term_votes_df.to_dicts(),
-        )
+_VOTES_SCHEMA = {
+    "vote_id": pl.Int64,
+    "term_id": pl.Int64,
+    "meeting_nr": pl.Int64,
+    "vote_number": pl.Int64,
+    "vote_datetime_local": pl.Utf8,
+    "vote_datetime_utc": pl.Utf8,
+    "title": pl.Utf8,
+    "result": pl.Utf8,
+}
 
-        if not (include_mp_pages or include_vote_pages):
-            continue
-
-        if include_mp_pages:
-            mp_root = out_assets_data_dir / "term" / str(term_id) / "mp"
-            _write_mp_pages(
-                mp_root / "full.abs0n",
-                term_id=term_id,
-                mp_rows=overview_full_abs0n.mps,
-                mp_votes_df=term_mp_votes_df,
-                invalid_club_vote_ids=invalid_club_vote_ids,
-                votes_df=term_votes_df,
-                club_color_map=club_color_map,
-                recent_votes_per_mp=recent_votes_per_mp,
-            )
-            _write_mp_pages(
-                mp_root / "full.abs0",
-                term_id=term_id,
-                mp_rows=overview_full_abs0.mps,
-                mp_votes_df=term_mp_votes_df,
-                invalid_club_vote_ids=invalid_club_vote_ids,
-                votes_df=term_votes_df,
-                club_color_map=club_color_map,
-                recent_votes_per_mp=recent_votes_per_mp,
-            )
-            invalid_window_votes = _invalid_club_vote_ids(window_mp_votes_df)
-            _write_mp_pages(
-                mp_root / "180d.abs0n",
-                term_id=term_id,
-                mp_rows=overview_180_abs0n.mps,
-                mp_votes_df=window_mp_votes_df,
-                invalid_club_vote_ids=invalid_window_votes,
-                votes_df=term_votes_df,
-                club_color_map=club_color_map,
-                recent_votes_per_mp=recent_votes_per_mp,
-            )
-            _write_mp_pages(
-                mp_root / "180d.abs0",
-                term_id=term_id,
-                mp_rows=overview_180_abs0.mps,
-                mp_votes_df=window_mp_votes_df,
-                invalid_club_vote_ids=invalid_window_votes,
-                votes_df=term_votes_df,
-                club_color_map=club_color_map,
-                recent_votes_per_mp=recent_votes_per_mp,
-            )
-            # Back-compat default.
-            _write_mp_pages(
-                mp_root,
-                term_id=term_id,
-                mp_rows=overview_full_abs0n.mps,
-                mp_votes_df=term_mp_votes_df,
-                invalid_club_vote_ids=invalid_club_vote_ids,
-                votes_df=term_votes_df,
-                club_color_map=club_color_map,
-                recent_votes_per_mp=recent_votes_per_mp,
-            )
 
-        if include_vote_pages:
-            _write_vote_pages(
-                out_assets_data_dir / "term" / str(term_id) / "vote",
-                term_id=term_id,
-                votes_df=term_votes_df,
-                mp_votes_df=term_mp_votes_df,
-                invalid_club_vote_ids=invalid_club_vote_ids,
-                club_color_map=club_color_map,
-            )
+def _scan_votes(votes_path: Path) -> pl.LazyFrame:
+    parquet_path = votes_path.with_suffix(".parquet")
+    if parquet_path.exists():
+        return pl.scan_parquet(parquet_path)
+    return pl.scan_ndjson(votes_path, schema_overrides=_VOTES_SCHEMA)
+
+
+_SITE_MP_VOTES_SCHEMA = {
+    "vote_id": pl.Int64,
+    "vote_datetime_utc": pl.Utf8,
+    "mp_id": pl.Int64,
+    "mp_name": pl.Utf8,
+    "club": pl.Utf8,
+    "vote_code": pl.Utf8,
+    "is_present": pl.Boolean,
+    "is_voted": pl.Boolean,
+}
 
 
 def _load_mp_votes_for_term(processed_dir: Path, term_id: int) -> pl.DataFrame:
     index_path = processed_dir / "mp_votes" / "index.json"
     if index_path.exists():
-        index = json.loads(index_path.read_text(encoding="utf-8"))
+        index = orjson.loads(index_path.read_bytes())
+        shards = [shard for shard in index.get("shards") or [] if shard.get("term_id") == term_id]
         shard_paths: list[Path] = []
-        for shard in index.get("shards") or []:
-            if shard.get("term_id") != term_id:
-                continue
+        for shard in shards:
             rel = shard.get("path")
             if isinstance(rel, str) and rel:
                 shard_paths.append(processed_dir / rel)
@@ -562,11 +686,27 @@ def _load_mp_votes_for_term(processed_dir: Path, term_id: int) -> pl.DataFrame:
         if not shard_paths:
             return pl.DataFrame()
 
-        return pl.concat([pl.read_ndjson(p) for p in shard_paths], how="vertical")
+        # Prefer the Parquet copies when every shard of the term has one (columnar, typed).
+        parquet_paths = [
+            processed_dir / rel
+            for rel in (shard.get("parquet_path") for shard in shards)
+            if isinstance(rel, str) and rel
+        ]
+        if len(parquet_paths) == len(shard_paths) and all(p.exists() for p in parquet_paths):
+            return pl.scan_parquet(parquet_paths).select(list(_SITE_MP_VOTES_SCHEMA)).collect()
+
+        # One scan over all shards; the pinned schema skips per-shard inference and reads
+        # only the columns the site uses.
+        return pl.scan_ndjson(shard_paths, schema=_SITE_MP_VOTES_SCHEMA).collect()
 
     legacy = processed_dir / "mp_votes.jsonl"
     if legacy.exists():
-        return pl.read_ndjson(legacy).filter(pl.col("term_id") == term_id)
+        return (
+            pl.scan_ndjson(legacy)
+            .filter(pl.col("term_id") == term_id)
+            .select(list(_SITE_MP_VOTES_SCHEMA))
+            .collect()
+        )
 
     raise FileNotFoundError(
         "Missing processed mp_votes shards (data/processed/mp_votes/index.json)."
@@ -579,7 +719,7 @@ def _write_mp_pages(
     term_id: int,
     mp_rows: list[dict[str, object]],
     mp_votes_df: pl.DataFrame,
-    invalid_club_vote_ids: set[int],
+    club_votes_df: pl.DataFrame,
     votes_df: pl.DataFrame,
     club_color_map: dict[str, str],
     recent_votes_per_mp: int,
@@ -588,54 +728,59 @@ def _write_mp_pages(
         ["vote_id", "vote_datetime_utc", "vote_datetime_local", "title", "result", "meeting_nr"]
     )
 
-    for mp in mp_rows:
-        mp_id = mp.get("mp_id")
-        mp_name = mp.get("mp_name")
-        if not isinstance(mp_id, int):
-            continue
-
-        summary = dict(mp) if isinstance(mp, dict) else {"term_id": term_id, "mp_id": mp_id, "mp_name": mp_name}
-
-        mp_rows = mp_votes_df.filter(pl.col("mp_id") == mp_id)
-        club_rows = mp_rows
-        if invalid_club_vote_ids:
-            club_rows = mp_rows.filter(~pl.col("vote_id").is_in(list(invalid_club_vote_ids)))
-        clubs = (
-            club_rows.group_by("club")
+    # One pass to split votes per MP instead of filtering the whole frame for every MP.
+    recent_by_mp: dict[tuple[object, ...], pl.DataFrame] = {}
+    clubs_by_mp: dict[tuple[object, ...], pl.DataFrame] = {}
+    if not mp_votes_df.is_empty():
+        # Rows arrive in _prepare_mp_votes order (oldest first, undated last); reversed, that is
+        # the newest-first order, so each MP's recent votes are just the head of its group.
+        recent_by_mp = (
+            mp_votes_df.select(["mp_id", "vote_id", "vote_code"])
+            .reverse()
+            .group_by("mp_id")
+            .head(recent_votes_per_mp)
+            .join(votes_lookup, on="vote_id", how="left", maintain_order="left")
+            .partition_by("mp_id", as_dict=True, include_key=False, maintain_order=True)
+        )
+        # Club breakdown for every MP in one group_by, then split per MP.
+        clubs_by_mp = (
+            club_votes_df.group_by(["mp_id", "club"])
             .agg(
                 total_votes=pl.len(),
-                present_count=pl.col("is_present").cast(pl.Int8).sum(),
-                voted_count=pl.col("is_voted").cast(pl.Int8).sum(),
-                absent_count=pl.col("vote_code").is_in(["0", "N"]).cast(pl.Int8).sum(),
+                present_count=pl.col("is_present").sum(),
+                voted_count=pl.col("is_voted").sum(),
+                absent_count=_count_codes(["0", "N"]),
             )
             .with_columns(
-                participation_rate=(pl.col("present_count") / pl.col("total_votes")).round(6)
+                participation_rate=(pl.col("present_count") / pl.col("total_votes")).round(6),
+                club_color=_club_color_expr(club_color_map),
             )
-            .sort(["participation_rate", "club"], descending=[True, False])
-            .to_dicts()
-        )
-        for row in clubs:
-            club_name = row.get("club")
-            if isinstance(club_name, str):
-                row["club_color"] = club_color_map.get(club_name)
-
-        recent = (
-            mp_rows.select(["vote_id", "vote_code"])
-            .join(votes_lookup, on="vote_id", how="left")
-            .sort(["vote_datetime_utc", "vote_id"], descending=[True, True])
-            .head(recent_votes_per_mp)
-            .to_dicts()
+            .sort(["mp_id", "participation_rate", "club"], descending=[False, True, False])
+            .partition_by("mp_id", as_dict=True, include_key=False, maintain_order=True)
         )
 
-        payload = {
-            "term_id": term_id,
-            "mp_id": mp_id,
-            "mp_name": mp_name,
-            "summary": summary,
-            "clubs_at_vote_time": clubs,
-            "recent_votes": recent,
-        }
-        _write_json(out_dir / f"{mp_id}.json", payload)
+    with _JsonFileWriter() as writer:
+        for mp in mp_rows:
+            mp_id = mp.get("mp_id")
+            mp_name = mp.get("mp_name")
+            if not isinstance(mp_id, int):
+                continue
+
+            club_rows = clubs_by_mp.get((mp_id,))
+            clubs = club_rows.to_dicts() if club_rows is not None else []
+
+            recent = recent_by_mp[(mp_id,)].to_dicts()
+
+            payload = {
+                "term_id": term_id,
+                "mp_id": mp_id,
+                "mp_name": mp_name,
+                # The overview row is only read here, so it is embedded without copying.
+                "summary": mp,
+                "clubs_at_vote_time": clubs,
+                "recent_votes": recent,
+            }
+            writer.write(out_dir / f"{mp_id}.json", payload)
 
 
 def _write_vote_pages(
@@ -644,54 +789,100 @@ def _write_vote_pages(
     term_id: int,
     votes_df: pl.DataFrame,
     mp_votes_df: pl.DataFrame,
-    invalid_club_vote_ids: set[int],
+    club_votes_df: pl.DataFrame,
     club_color_map: dict[str, str],
 ) -> None:
-    votes_lookup: dict[int, dict[str, object]] = {}
-    for row in votes_df.to_dicts():
-        vote_id = row.get("vote_id")
-        if isinstance(vote_id, int):
-            votes_lookup[vote_id] = row
-
-    partitions = mp_votes_df.partition_by(["vote_id"], maintain_order=True, as_dict=True)
-    for key, shard_df in partitions.items():
-        vote_id = key[0] if isinstance(key, tuple) else key
-        if not isinstance(vote_id, int):
-            continue
-
-        vote = votes_lookup.get(vote_id) or {"vote_id": vote_id, "term_id": term_id}
-        mps = shard_df.select(["mp_id", "mp_name", "club", "vote_code"]).to_dicts()
-        if invalid_club_vote_ids and vote_id in invalid_club_vote_ids:
-            clubs = []
-        else:
-            clubs = (
-                shard_df.group_by("club")
-                .agg(
-                    total=pl.len(),
-                    absent=pl.col("vote_code").is_in(["0", "N"]).cast(pl.Int8).sum(),
-                    present=pl.col("is_present").cast(pl.Int8).sum(),
-                )
-                .with_columns(presence_rate=(pl.col("present") / pl.col("total")).round(6))
-                .sort(["presence_rate", "club"], descending=[True, False])
-                .to_dicts()
-            )
-            for row in clubs:
-                club_name = row.get("club")
-                if isinstance(club_name, str):
-                    row["club_color"] = club_color_map.get(club_name)
-
-        payload = {
-            "term_id": term_id,
-            "vote": vote,
-            "clubs": clubs,
-            "mps": mps,
-        }
-        _write_json(out_dir / f"{vote_id}.json", payload)
+    if mp_votes_df.is_empty():
+        return
+
+    # Only votes that get a page are turned into Python dicts.
+    votes_lookup = votes_df.join(
+        mp_votes_df.select("vote_id").unique(), on="vote_id", how="semi"
+    ).rows_by_key("vote_id", named=True, include_key=True, unique=True)
+
+    mps_by_vote = mp_votes_df.select(
+        ["vote_id", "mp_id", "mp_name", "club", "vote_code"]
+    ).partition_by("vote_id", maintain_order=True, as_dict=True, include_key=False)
+    # Club breakdown for every vote in one group_by, then split per vote.
+    clubs_by_vote = (
+        club_votes_df.group_by(["vote_id", "club"])
+        .agg(
+            total=pl.len(),
+            absent=_count_codes(["0", "N"]),
+            present=pl.col("is_present").sum(),
+        )
+        .with_columns(
+            presence_rate=(pl.col("present") / pl.col("total")).round(6),
+            club_color=_club_color_expr(club_color_map),
+        )
+        .sort(["vote_id", "presence_rate", "club"], descending=[False, True, False])
+        .partition_by("vote_id", as_dict=True, include_key=False, maintain_order=True)
+    )
+    with _JsonFileWriter() as writer:
+        for key, mps_df in mps_by_vote.items():
+            vote_id = key[0] if isinstance(key, tuple) else key
+            if not isinstance(vote_id, int):
+                continue
+
+            vote = votes_lookup.get(vote_id) or {"vote_id": vote_id, "term_id": term_id}
+            mps = mps_df.to_dicts()
+            club_rows = clubs_by_vote.get((vote_id,))
+            clubs = club_rows.to_dicts() if club_rows is not None else []
+
+            payload = {
+                "term_id": term_id,
+                "vote": vote,
+                "clubs": clubs,
+                "mps": mps,
+            }
+            writer.write(out_dir / f"{vote_id}.json", payload)
+
+
+def _club_color_expr(club_color_map: dict[str, str]) -> pl.Expr:
+    return pl.col("club").replace_strict(club_color_map, default=None, return_dtype=pl.Utf8)
+
+
+def _encode_json(obj: object) -> bytes:
+    return orjson.dumps(
+        obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE
+    )
 
 
 def _write_json(path: Path, obj: object) -> None:
+    _write_bytes(path, _encode_json(obj))
+
+
+class _JsonFileWriter:
+    """
+    Writes many small JSON files (per-MP / per-vote pages).
+
+    Payloads are encoded on the calling thread; the file writes, which release the GIL,
+    are handed to a small thread pool so disk I/O overlaps with building the next payload.
+    """
+
+    def __init__(self, max_workers: int = 8) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._futures: list[Future[int]] = []
+        # Pages share a handful of directories; create each once per writer, not per file.
+        self._dirs: set[Path] = set()
+
+    def write(self, path: Path, obj: object) -> None:
+        data = _encode_json(obj)
+        if path.parent not in self._dirs:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._dirs.add(path.parent)
+        self._futures.append(self._executor.submit(path.write_bytes, data))
+
+    def __enter__(self) -> _JsonFileWriter:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._executor.shutdown(wait=True)
+        if exc_type is None:
+            for future in self._futures:
+                future.result()
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(
-        json.dumps(obj, ensure_ascii=False, sort_keys=True, indent=2) + "\n",
-        encoding="utf-8",
-    )
+    path.write_bytes(data)
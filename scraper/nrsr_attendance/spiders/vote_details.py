@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import json
+import os
 from collections.abc import Iterable
 from pathlib import Path
 
+import orjson
 import scrapy
 
 from nrsr_attendance.spiders.votes import VotesSpider
@@ -40,6 +41,9 @@ class VoteDetailsSpider(VotesSpider):
             self.logger.warning("No vote_index directory found at %s", index_root)
             return
 
+        # One directory listing instead of a stat per indexed vote.
+        existing_ids = set() if self._force else _existing_vote_ids(votes_root)
+
         shard_paths = sorted(index_root.glob("*/*.jsonl"))
         for shard_path in shard_paths:
             try:
@@ -58,8 +62,7 @@ class VoteDetailsSpider(VotesSpider):
                 if not isinstance(vote_id, int):
                     continue
 
-                out_path = votes_root / f"{vote_id}.json"
-                if out_path.exists() and not self._force:
+                if str(vote_id) in existing_ids:
                     continue
 
                 url = rec.get("hlasklub_url")
@@ -88,10 +91,18 @@ def _parse_int_set(value: str | None) -> set[int] | None:
     return items or None
 
 
+def _existing_vote_ids(votes_root: Path) -> set[str]:
+    # File stems of data/raw/votes/<vote_id>.json, matched against str(vote_id).
+    if not votes_root.is_dir():
+        return set()
+    with os.scandir(votes_root) as entries:
+        return {entry.name[:-5] for entry in entries if entry.name.endswith(".json")}
+
+
 def _iter_jsonl(path: Path) -> Iterable[dict]:
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            yield json.loads(line)
+    # Shards are small; read each in one go and decode lines with orjson.
+    for line in path.read_bytes().splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        yield orjson.loads(line)
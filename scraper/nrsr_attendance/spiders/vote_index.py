@@ -1,10 +1,12 @@
 import re
 from datetime import UTC, datetime
-from urllib.parse import parse_qs, urljoin, urlparse
 
 import scrapy
 from scrapy.http import FormRequest
 
+from nrsr_attendance.pipelines import _load_done_meetings
+from nrsr_attendance.spiders.votes import _url_joiner
+
 _EVENT_TARGET_TERM = "_sectionLayoutContainer$ctl01$_termNrCombo"
 _EVENT_TARGET_GRID = "_sectionLayoutContainer$ctl01$_resultGrid2"
 _NAME_TERM = "_sectionLayoutContainer$ctl01$_termNrCombo"
@@ -12,8 +14,19 @@ _NAME_MEETING = "_sectionLayoutContainer$ctl01$_meetingNrCombo"
 _ID_TERM = "_sectionLayoutContainer_ctl01__termNrCombo"
 _ID_MEETING = "_sectionLayoutContainer_ctl01__meetingNrCombo"
 
+_BACKFILL_SETTINGS = {
+    "CONCURRENT_REQUESTS_PER_DOMAIN": 8,
+    "AUTOTHROTTLE_TARGET_CONCURRENCY": 4.0,
+}
+
 _VOTE_ID_RE = re.compile(r"[?&]ID=(?P<id>[0-9]+)")
-_POSTBACK_ARG_RE = re.compile(r"__doPostBack\('(?P<target>[^']+)','(?P<arg>[^']+)'\)")
+# Whether the results grid header has the meeting number column, evaluated by lxml in one query.
+_HAS_MEETING_COL_XPATH = (
+    "boolean(//*[@id='_sectionLayoutContainer_ctl01__resultGrid2']"
+    "//tr[contains(concat(' ', normalize-space(@class), ' '), ' tab_zoznam_header ')]"
+    "//th[contains(normalize-space(.), 'Číslo schôdze')])"
+)
+_PAGER_PAGE_RE = re.compile(r"__doPostBack\('[^']+','Page\$(?P<page>[0-9]+)'\)")
 
 
 def _parse_int(value: str | None) -> int | None:
@@ -37,15 +50,6 @@ def _extract_vote_id(href: str | None) -> int | None:
     return int(match.group("id"))
 
 
-def _postback_arg(href: str | None) -> str | None:
-    if not href:
-        return None
-    match = _POSTBACK_ARG_RE.search(href)
-    if not match:
-        return None
-    return match.group("arg")
-
-
 class VoteIndexSpider(scrapy.Spider):
     """
     Discovery spider that produces per-meeting vote index shards (JSONL).
@@ -77,6 +81,7 @@ class VoteIndexSpider(scrapy.Spider):
         mode: str | None = None,
         terms: str | None = None,
         meetings: str | None = None,
+        force: str | None = None,
         **kwargs,
     ):
         super().__init__(*args, **kwargs)
@@ -92,6 +97,23 @@ class VoteIndexSpider(scrapy.Spider):
         if meetings:
             self._meetings_filter = {int(m.strip()) for m in meetings.split(",") if m.strip()}
 
+        # Backfill skips meetings whose every results page was indexed by an earlier run.
+        # Meetings of the site's current term are never marked done: they may still get votes.
+        self._force = (force or "").strip().lower() in {"1", "true", "yes", "y"}
+        self._current_term: int | None = None
+        self._done_meetings: set[tuple[int, int]] = set()
+        if self._mode == "backfill" and not self._force:
+            self._done_meetings = _load_done_meetings()
+
+    @classmethod
+    def from_crawler(cls, crawler, *args, **kwargs):
+        spider = super().from_crawler(crawler, *args, **kwargs)
+        if spider._mode == "backfill":
+            # Backfill walks every results page of every meeting and is bound by response time,
+            # so it gets more slots; AutoThrottle still backs off when the server slows down.
+            crawler.settings.setdict(_BACKFILL_SETTINGS, priority="spider")
+        return spider
+
     def parse(self, response: scrapy.http.Response):
         if self._mode == "update":
             yield from self._parse_latest_listing(response)
@@ -104,6 +126,7 @@ class VoteIndexSpider(scrapy.Spider):
             term_ids = [t for t in term_ids if t in self._terms_filter]
 
         selected_term = _parse_int(response.css(f"#{_ID_TERM} option[selected]::attr(value)").get())
+        self._current_term = selected_term
 
         for term_id in term_ids:
             if term_id == selected_term:
@@ -136,6 +159,8 @@ class VoteIndexSpider(scrapy.Spider):
                 continue
             if self._meetings_filter is not None and meeting_id not in self._meetings_filter:
                 continue
+            if (term_id, meeting_id) in self._done_meetings:
+                continue
             meetings.append((meeting_id, label))
 
         for meeting_id, meeting_label in meetings:
@@ -164,12 +189,17 @@ class VoteIndexSpider(scrapy.Spider):
         meeting_id: int,
         meeting_label: str,
         page: int,
+        seen_vote_ids: set[int] | None = None,
     ):
+        # Shared by all pages of one meeting, so rows repeated across pages are emitted once.
+        if seen_vote_ids is None:
+            seen_vote_ids = set()
         yield from self._parse_results_table(
             response,
             term_id=term_id,
             meeting_id=meeting_id,
             meeting_label=meeting_label,
+            seen_vote_ids=seen_vote_ids,
         )
 
         max_page = self._max_page(response)
@@ -187,26 +217,30 @@ class VoteIndexSpider(scrapy.Spider):
                     "meeting_id": meeting_id,
                     "meeting_label": meeting_label,
                     "page": next_page,
+                    "seen_vote_ids": seen_vote_ids,
                 },
             )
+            return
+
+        # Last results page: VoteIndexJsonlPipeline records the meeting as done. Without a known
+        # current term any meeting could still be getting votes, so none is marked done.
+        if self._current_term is not None and term_id != self._current_term:
+            yield {"kind": "meeting_done", "term_id": term_id, "meeting_id": meeting_id}
 
     @staticmethod
     def _max_page(response: scrapy.http.Response) -> int | None:
-        args: list[int] = []
-        for href in response.css(
+        # One regex pass over all pager hrefs instead of a postback parse per link.
+        hrefs = response.css(
             "#_sectionLayoutContainer_ctl01__resultGrid2 tr.pager a::attr(href)"
-        ):
-            arg = _postback_arg(href.get())
-            if not arg:
-                continue
-            if arg.startswith("Page$"):
-                n = _parse_int(arg.split("$", 1)[1])
-                if n is not None:
-                    args.append(n)
-        return max(args) if args else None
+        ).getall()
+        pages = [int(n) for n in _PAGER_PAGE_RE.findall("\n".join(hrefs))]
+        return max(pages) if pages else None
 
     def _parse_latest_listing(self, response: scrapy.http.Response):
         term_id = _parse_int(response.css(f"#{_ID_TERM} option[selected]::attr(value)").get())
+        # One timestamp per fetched page, shared by all of its rows.
+        fetched_at_utc = datetime.now(UTC).replace(microsecond=0).isoformat()
+        join_url = _url_joiner(response.url)
 
         rows = response.css("#_sectionLayoutContainer_ctl01__resultGrid2 tr")[1:]
         for row in rows:
@@ -230,11 +264,11 @@ class VoteIndexSpider(scrapy.Spider):
                 t.strip() for t in row.css("td:nth-child(5) *::text").getall() if t.strip()
             )
 
-            hlasovanie_url = urljoin(response.url, vote_link)
+            hlasovanie_url = join_url(vote_link)
             hlasklub_link = row.css(
                 "a[href*='sid=schodze/hlasovanie/hlasklub&ID=']::attr(href)"
             ).get()
-            hlasklub_url = urljoin(response.url, hlasklub_link) if hlasklub_link else None
+            hlasklub_url = join_url(hlasklub_link) if hlasklub_link else None
 
             if meeting_nr is None:
                 continue
@@ -255,7 +289,7 @@ class VoteIndexSpider(scrapy.Spider):
                 or f"https://www.nrsr.sk/web/Default.aspx?sid=schodze/hlasovanie/hlasklub&ID={vote_id}",
                 "source_url": response.url,
                 "http_status": response.status,
-                "fetched_at_utc": datetime.now(UTC).replace(microsecond=0).isoformat(),
+                "fetched_at_utc": fetched_at_utc,
             }
 
     def _parse_results_table(
@@ -265,14 +299,11 @@ class VoteIndexSpider(scrapy.Spider):
         term_id: int,
         meeting_id: int,
         meeting_label: str,
+        seen_vote_ids: set[int],
     ):
-        header_texts = [
-            " ".join(t.strip() for t in th.css("::text").getall() if t.strip())
-            for th in response.css(
-                "#_sectionLayoutContainer_ctl01__resultGrid2 tr.tab_zoznam_header th"
-            )
-        ]
-        has_meeting_col = any("Číslo schôdze" in t for t in header_texts)
+        has_meeting_col = response.xpath(_HAS_MEETING_COL_XPATH).get() == "1"
+        fetched_at_utc = datetime.now(UTC).replace(microsecond=0).isoformat()
+        join_url = _url_joiner(response.url)
 
         # Some result views hide the meeting number column (ShowCisloSchodze=False). In that case,
         # columns shift left by 1 and we should rely on meeting_id from context.
@@ -291,57 +322,45 @@ class VoteIndexSpider(scrapy.Spider):
             idx_title = 4
             idx_hlasklub = 5
 
+        # The column layout is fixed per page, so the per-column selectors are built once here.
+        css_meeting = f"td:nth-child({idx_meeting})::text" if idx_meeting is not None else None
+        css_date = f"td:nth-child({idx_date}) *::text, td:nth-child({idx_date})::text"
+        css_vote_number = f"td:nth-child({idx_vote}) a::text"
+        css_cpt = f"td:nth-child({idx_cpt}) a[href*='sid=zakony/cpt']::attr(href)"
+        css_title = f"td:nth-child({idx_title}) *::text, td:nth-child({idx_title})::text"
+        css_hlasklub = (
+            f"td:nth-child({idx_hlasklub}) "
+            "a[href*='sid=schodze/hlasovanie/hlasklub&ID=']::attr(href)"
+        )
+
         for row in response.css(
             "#_sectionLayoutContainer_ctl01__resultGrid2 tr.tab_zoznam_alt, "
             "#_sectionLayoutContainer_ctl01__resultGrid2 tr.tab_zoznam_nonalt"
         ):
-            meeting_nr = (
-                meeting_id
-                if idx_meeting is None
-                else _parse_int(row.css(f"td:nth-child({idx_meeting})::text").get())
-            )
-            date_time_text = " ".join(
-                t.strip()
-                for t in row.css(
-                    f"td:nth-child({idx_date}) *::text, td:nth-child({idx_date})::text"
-                ).getall()
-                if t.strip()
-            )
-
             vote_href = row.css(
                 "a[href*='sid=schodze/hlasovanie/hlasovanie&ID=']::attr(href)"
             ).get()
             vote_id = _extract_vote_id(vote_href)
-            if vote_id is None:
+            if vote_id is None or vote_id in seen_vote_ids:
                 continue
-            hlasovanie_url = urljoin(response.url, vote_href)
+            seen_vote_ids.add(vote_id)
 
-            vote_number = _parse_int(row.css(f"td:nth-child({idx_vote}) a::text").get())
+            meeting_nr = (
+                meeting_id if css_meeting is None else _parse_int(row.css(css_meeting).get())
+            )
+            date_time_text = " ".join(t.strip() for t in row.css(css_date).getall() if t.strip())
+            hlasovanie_url = join_url(vote_href)
 
-            cpt_href = row.css(
-                f"td:nth-child({idx_cpt}) a[href*='sid=zakony/cpt']::attr(href)"
-            ).get()
-            cpt_id = None
-            if cpt_href:
-                parsed = urlparse(urljoin(response.url, cpt_href))
-                query = parse_qs(parsed.query)
-                values = query.get("ID")
-                cpt_id = _parse_int(values[0]) if values else None
+            vote_number = _parse_int(row.css(css_vote_number).get())
 
-            title = " ".join(
-                t.strip()
-                for t in row.css(
-                    f"td:nth-child({idx_title}) *::text, td:nth-child({idx_title})::text"
-                ).getall()
-                if t.strip()
-            )
+            cpt_href = row.css(css_cpt).get()
+            cpt_id = _extract_vote_id(cpt_href)
 
-            hlasklub_href = row.css(
-                f"td:nth-child({idx_hlasklub}) "
-                "a[href*='sid=schodze/hlasovanie/hlasklub&ID=']::attr(href)"
-            ).get()
+            title = " ".join(t.strip() for t in row.css(css_title).getall() if t.strip())
+
+            hlasklub_href = row.css(css_hlasklub).get()
             hlasklub_url = (
-                urljoin(response.url, hlasklub_href)
+                join_url(hlasklub_href)
                 if hlasklub_href
                 else f"https://www.nrsr.sk/web/Default.aspx?sid=schodze/hlasovanie/hlasklub&ID={vote_id}"
             )
@@ -361,5 +380,5 @@ class VoteIndexSpider(scrapy.Spider):
                 "hlasklub_url": hlasklub_url,
                 "source_url": response.url,
                 "http_status": response.status,
-                "fetched_at_utc": datetime.now(UTC).replace(microsecond=0).isoformat(),
+                "fetched_at_utc": fetched_at_utc,
             }
@@ -1,10 +1,25 @@
 import re
+from collections.abc import Callable
 from datetime import UTC, datetime
-from urllib.parse import parse_qs, urljoin, urlparse
+from functools import lru_cache
+from urllib.parse import urljoin
 
 import scrapy
+from lxml import etree
 
 _VOTE_ID_RE = re.compile(r"[?&]ID=(?P<id>[0-9]+)")
+_VOTE_CODE_RE = re.compile(r"\[(?P<code>.)\]")
+
+# parse_vote walks ~150 MP cells per vote; these run on the raw lxml row/cell elements and return
+# plain lists, skipping parsel's per-query Selector/SelectorList wrapping.
+_X_CLUB_HEADER = etree.XPath(
+    "descendant-or-self::td[@class and contains(concat(' ', normalize-space(@class), ' '),"
+    " ' hpo_result_block_title ')]/text()"
+)
+_X_CELLS = etree.XPath("descendant-or-self::td")
+_X_LINKS = etree.XPath("descendant-or-self::a")
+_X_LINK_TEXT = etree.XPath("descendant-or-self::a/text()")
+_X_TEXT = etree.XPath("text()")
 
 
 def _parse_int(value: str | None) -> int | None:
@@ -26,12 +41,33 @@ def _extract_vote_id(href: str) -> int | None:
     return int(match.group("id"))
 
 
+@lru_cache(maxsize=16)
+def _query_int_re(key: str) -> re.Pattern[str]:
+    return re.compile(rf"[?&]{re.escape(key)}=(?P<value>[0-9]+)(?:[&#]|$)")
+
+
 def _extract_query_int(url: str, key: str) -> int | None:
-    parsed = urlparse(url)
-    values = parse_qs(parsed.query).get(key)
-    if not values:
+    # Regex instead of urlparse + parse_qs: called for every MP cell of a vote page.
+    match = _query_int_re(key).search(url)
+    if not match:
         return None
-    return _parse_int(values[0])
+    return int(match.group("value"))
+
+
+def _url_joiner(base_url: str) -> Callable[[str], str]:
+    # nrsr.sk links are "Default.aspx?..." or "?..." relative to the page they appear on; those two
+    # shapes are joined by concatenation and anything else still goes through urljoin.
+    page = base_url.split("#", 1)[0].split("?", 1)[0]
+    directory = urljoin(page, ".")
+
+    def join(href: str) -> str:
+        if href.startswith("?"):
+            return page + href
+        if href.startswith("Default.aspx?"):
+            return directory + href
+        return urljoin(base_url, href)
+
+    return join
 
 
 class VotesSpider(scrapy.Spider):
@@ -82,6 +118,7 @@ class VotesSpider(scrapy.Spider):
             ).get()
         )
 
+        cutoff = 0 if self._force else self._last_seen_id
         rows = response.css("#_sectionLayoutContainer_ctl01__resultGrid2 tr")[1:]
         found: list[dict] = []
         for row in rows:
@@ -91,7 +128,8 @@ class VotesSpider(scrapy.Spider):
             if not vote_link:
                 continue
             vote_id = _extract_vote_id(vote_link)
-            if vote_id is None:
+            # Already-fetched votes are dropped before the remaining cells are parsed.
+            if vote_id is None or vote_id <= cutoff:
                 continue
 
             meeting_nr = _parse_int(row.css("td:nth-child(1)::text").get())
@@ -113,10 +151,7 @@ class VotesSpider(scrapy.Spider):
                 }
             )
 
-        found.sort(key=lambda x: x["vote_id"], reverse=True)
-
-        cutoff = 0 if self._force else self._last_seen_id
-        new_votes = [v for v in found if v["vote_id"] > cutoff]
+        new_votes = sorted(found, key=lambda x: x["vote_id"], reverse=True)
         if not new_votes:
             if self._force:
                 self.logger.info("Force enabled, but no votes were discovered on the page.")
@@ -156,44 +191,50 @@ class VotesSpider(scrapy.Spider):
         else:
             stats_summary = {}
 
-        mp_votes: list[dict] = []
+        # (club, mp_name, mp_id, vote_code, position, mp_vote): plain tuples sort in C without a
+        # key function; position breaks full ties so the mp_vote dicts are never compared.
+        keyed_votes: list[tuple[str, str, int, str, int, dict]] = []
         current_club: str | None = None
+        join_url = _url_joiner(response.url)
         for row in response.css("#_sectionLayoutContainer_ctl01__resultsTable tr"):
-            header = row.css("td.hpo_result_block_title::text").get()
-            if header:
-                current_club = header.strip() or None
+            header = _X_CLUB_HEADER(row.root)
+            if header and header[0]:
+                current_club = header[0].strip() or None
                 continue
 
-            for cell in row.css("td"):
-                link = cell.css("a")
-                if not link:
+            for cell in _X_CELLS(row.root):
+                links = _X_LINKS(cell)
+                if not links:
                     continue
-                mp_name = (link.css("::text").get() or "").strip()
-                href = link.attrib.get("href", "")
-                mp_id = _extract_query_int(urljoin(response.url, href), "PoslanecID")
+                link_text = _X_LINK_TEXT(cell)
+                mp_name = str(link_text[0]).strip() if link_text else ""
+                mp_url = join_url(links[0].get("href", ""))
+                mp_id = _extract_query_int(mp_url, "PoslanecID")
 
-                code_text = "".join(t.strip() for t in cell.xpath("text()").getall() if t.strip())
-                code_match = re.search(r"\[(?P<code>.)\]", code_text)
+                code_text = "".join(t.strip() for t in _X_TEXT(cell) if t.strip())
+                code_match = _VOTE_CODE_RE.search(code_text)
                 vote_code = code_match.group("code") if code_match else None
 
-                mp_votes.append(
-                    {
-                        "mp_id": mp_id,
-                        "mp_name": mp_name,
-                        "club": current_club,
-                        "vote_code": vote_code,
-                        "mp_url": urljoin(response.url, href),
-                    }
+                mp_vote = {
+                    "mp_id": mp_id,
+                    "mp_name": mp_name,
+                    "club": current_club,
+                    "vote_code": vote_code,
+                    "mp_url": mp_url,
+                }
+                keyed_votes.append(
+                    (
+                        current_club or "",
+                        mp_name,
+                        mp_id or 0,
+                        vote_code or "",
+                        len(keyed_votes),
+                        mp_vote,
+                    )
                 )
 
-        mp_votes.sort(
-            key=lambda m: (
-                (m.get("club") or ""),
-                (m.get("mp_name") or ""),
-                (m.get("mp_id") or 0),
-                (m.get("vote_code") or ""),
-            )
-        )
+        keyed_votes.sort()
+        mp_votes = [entry[-1] for entry in keyed_votes]
 
         item = {
             "kind": "vote",
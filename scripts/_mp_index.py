@@ -0,0 +1,39 @@
+"""MP list and slug helpers shared by build_mp_pages.py and build_sitemap.py."""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from pathlib import Path
+
+import orjson
+
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
+
+def slugify(value: str) -> str:
+    # ASCII is unchanged by NFKD and has no combining marks, so only non-ASCII names need them.
+    if value.isascii():
+        normalized = value
+    else:
+        normalized = unicodedata.normalize("NFKD", value)
+        normalized = "".join(ch for ch in normalized if not unicodedata.combining(ch))
+    normalized = normalized.casefold()
+    return _NON_ALNUM_RE.sub("-", normalized).strip("-") or "unknown"
+
+
+def collect_mps(data_dir: Path, terms: list[int]) -> list[tuple[int, str]]:
+    # (mp_id, mp_name) across the given terms, sorted by mp_id; a later term's non-empty name wins.
+    mp_ids: dict[int, str] = {}
+    for term_id in terms:
+        overview_path = data_dir / "term" / str(term_id) / "overview.full.abs0n.json"
+        try:
+            overview = orjson.loads(overview_path.read_bytes())
+        except FileNotFoundError:
+            continue
+        for mp in overview.get("mps", []):
+            mp_id = mp.get("mp_id")
+            mp_name = mp.get("mp_name")
+            if isinstance(mp_id, int):
+                mp_ids[mp_id] = str(mp_name or mp_ids.get(mp_id) or "")
+    return sorted(mp_ids.items())
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import argparse
-import json
-import re
-import unicodedata
+import string
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import orjson
+from _mp_index import collect_mps, slugify
 
 TEMPLATE = """<!doctype html>
 <html lang="sk">
@@ -100,13 +101,31 @@ TEMPLATE = """<!doctype html>
 """
 
 
-def slugify(value: str) -> str:
-    normalized = unicodedata.normalize("NFKD", value)
-    normalized = "".join(ch for ch in normalized if not unicodedata.combining(ch))
-    normalized = normalized.casefold()
-    normalized = re.sub(r"[^a-z0-9]+", "-", normalized)
-    normalized = re.sub(r"-{2,}", "-", normalized).strip("-")
-    return normalized or "unknown"
+# TEMPLATE split once into (literal bytes, field name) pairs; rendering then only joins bytes
+# instead of re-parsing the template and re-encoding all of its text for every MP.
+_TEMPLATE_PARTS = [
+    (literal.encode("utf-8"), field)
+    for literal, field, _spec, _conv in string.Formatter().parse(TEMPLATE)
+]
+
+
+def _render(**fields: str) -> bytes:
+    out: list[bytes] = []
+    for literal, field in _TEMPLATE_PARTS:
+        out.append(literal)
+        if field is not None:
+            out.append(fields[field].encode("utf-8"))
+    return b"".join(out)
+
+
+def _write_if_changed(dest: Path, data: bytes) -> None:
+    # Pages rarely change between builds; leaving identical files untouched keeps their mtimes.
+    try:
+        if dest.read_bytes() == data:
+            return
+    except FileNotFoundError:
+        dest.parent.mkdir(parents=True, exist_ok=True)
+    dest.write_bytes(data)
 
 
 def _parse_terms(value: str) -> list[int] | None:
@@ -143,30 +162,19 @@ def main() -> int:
     )
     args = parser.parse_args()
 
-    manifest = json.loads((args.data_dir / "manifest.json").read_text(encoding="utf-8"))
+    manifest = orjson.loads((args.data_dir / "manifest.json").read_bytes())
     terms = _parse_terms(args.terms) or manifest.get("terms") or []
-    mp_ids: dict[int, str] = {}
 
-    for term_id in terms:
-        overview_path = args.data_dir / "term" / str(term_id) / "overview.full.abs0n.json"
-        if not overview_path.exists():
-            continue
-        overview = json.loads(overview_path.read_text(encoding="utf-8"))
-        for mp in overview.get("mps", []):
-            mp_id = mp.get("mp_id")
-            mp_name = mp.get("mp_name")
-            if isinstance(mp_id, int):
-                mp_ids[mp_id] = str(mp_name or mp_ids.get(mp_id) or "")
-
-    for mp_id in sorted(mp_ids):
-        mp_name = mp_ids.get(mp_id) or ""
+    pages: list[tuple[Path, bytes]] = []
+    for mp_id, mp_name in collect_mps(args.data_dir, terms):
         slug = slugify(mp_name)
         dest = args.out_dir / f"{mp_id}-{slug}" / "index.html"
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        dest.write_text(
-            TEMPLATE.format(mp_id=mp_id, mp_name=mp_name, slug=slug),
-            encoding="utf-8",
-        )
+        pages.append((dest, _render(mp_id=str(mp_id), mp_name=mp_name, slug=slug)))
+
+    # File I/O releases the GIL, so a few threads overlap the per-page syscalls.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for _ in executor.map(lambda page: _write_if_changed(*page), pages):
+            pass
 
     return 0
 
@@ -50,11 +50,21 @@ def main() -> int:
         default=20,
         help="How many recent votes to include on each MP payload.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes used to build terms in parallel (default: CPU count, 1 disables).",
+    )
     args = parser.parse_args()
 
     _add_scraper_to_path()
+    import polars as pl
     from nrsr_attendance.site_data import build_site_data  # noqa: I001
 
+    # The per-term overview plans run streaming; build_site_data passes this to its workers.
+    pl.Config.set_engine_affinity("streaming")
+
     build_site_data(
         args.processed_dir,
         args.out_dir,
@@ -62,6 +72,7 @@ def main() -> int:
         include_mp_pages=bool(args.include_mp_pages),
         include_vote_pages=bool(args.include_vote_pages),
         recent_votes_per_mp=int(args.recent_votes_per_mp),
+        workers=args.workers,
     )
     return 0
 
@@ -36,8 +36,11 @@ def main() -> None:
     parser.add_argument(
         "--concurrent",
         type=int,
-        default=2,
-        help="CONCURRENT_REQUESTS_PER_DOMAIN (higher is faster, but be polite).",
+        default=8,
+        help=(
+            "CONCURRENT_REQUESTS_PER_DOMAIN (higher is faster, but be polite). "
+            "AutoThrottle still backs off when responses slow down."
+        ),
     )
     parser.add_argument(
         "--download-delay",
@@ -67,13 +70,15 @@ def main() -> None:
         index_root = repo_root / "data" / "raw" / "vote_index"
         term_ids: list[int] = []
         if index_root.exists():
-            for p in index_root.iterdir():
-                if not p.is_dir():
-                    continue
-                try:
-                    term_ids.append(int(p.name))
-                except ValueError:
-                    continue
+            # DirEntry.is_dir() answers from the listing; only symlinked entries need a stat.
+            with os.scandir(index_root) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        continue
+                    try:
+                        term_ids.append(int(entry.name))
+                    except ValueError:
+                        continue
         if not term_ids:
             print(
                 "No vote index shards found under data/raw/vote_index; "
@@ -85,7 +90,6 @@ def main() -> None:
 
     os.environ.setdefault("SCRAPY_SETTINGS_MODULE", "nrsr_attendance.settings")
     sys.path.insert(0, str(scraper_dir))
-    os.chdir(scraper_dir)
 
     settings = get_project_settings()
     settings.set("CONCURRENT_REQUESTS_PER_DOMAIN", args.concurrent, priority="cmdline")
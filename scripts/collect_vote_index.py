@@ -25,11 +25,19 @@ def main() -> None:
         default="",
         help="Comma-separated meeting IDs to include (e.g. 43 or 43,44,1001). Empty means all.",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Backfill: re-crawl meetings already recorded as done in data/raw/_state.json.",
+    )
     parser.add_argument(
         "--concurrent",
         type=int,
-        default=2,
-        help="CONCURRENT_REQUESTS_PER_DOMAIN (higher is faster, but be polite).",
+        default=None,
+        help=(
+            "CONCURRENT_REQUESTS_PER_DOMAIN (higher is faster, but be polite). "
+            "Default: 2 for update, 8 for backfill."
+        ),
     )
     parser.add_argument(
         "--download-delay",
@@ -56,10 +64,10 @@ def main() -> None:
 
     os.environ.setdefault("SCRAPY_SETTINGS_MODULE", "nrsr_attendance.settings")
     sys.path.insert(0, str(scraper_dir))
-    os.chdir(scraper_dir)
 
     settings = get_project_settings()
-    settings.set("CONCURRENT_REQUESTS_PER_DOMAIN", args.concurrent, priority="cmdline")
+    if args.concurrent is not None:
+        settings.set("CONCURRENT_REQUESTS_PER_DOMAIN", args.concurrent, priority="cmdline")
     settings.set("AUTOTHROTTLE_ENABLED", bool(args.autothrottle), priority="cmdline")
     if args.download_delay is not None:
         settings.set("DOWNLOAD_DELAY", float(args.download_delay), priority="cmdline")
@@ -70,6 +78,7 @@ def main() -> None:
         mode=args.mode,
         terms=args.terms or None,
         meetings=args.meetings or None,
+        force="1" if args.force else None,
     )
     process.start()
 
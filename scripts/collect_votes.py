@@ -23,8 +23,9 @@ def main() -> None:
     scraper_dir = repo_root / "scraper"
 
     os.environ.setdefault("SCRAPY_SETTINGS_MODULE", "nrsr_attendance.settings")
+    # Settings come from SCRAPY_SETTINGS_MODULE and the pipelines write to absolute repo paths,
+    # so the process keeps its working directory instead of switching into scraper/.
     sys.path.insert(0, str(scraper_dir))
-    os.chdir(scraper_dir)
 
     process = CrawlerProcess(get_project_settings())
     process.crawl("votes", force="1" if args.force else "0")
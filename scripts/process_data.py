@@ -17,12 +17,27 @@ def main() -> int:
     parser.add_argument("--raw-dir", type=Path, default=Path("data/raw"))
     parser.add_argument("--out-dir", type=Path, default=Path("data/processed"))
     parser.add_argument("--schema-version", type=int, default=1)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes used to parse raw vote files (default: CPU count, 1 disables).",
+    )
     args = parser.parse_args()
 
     _add_scraper_to_path()
+    import polars as pl
     from nrsr_attendance.processing import process_votes  # noqa: I001
 
-    process_votes(args.raw_dir / "votes", args.out_dir, schema_version=args.schema_version)
+    # process_votes' aggregations and mp_votes shard sinks run on the streaming engine.
+    pl.Config.set_engine_affinity("streaming")
+
+    process_votes(
+        args.raw_dir / "votes",
+        args.out_dir,
+        schema_version=args.schema_version,
+        workers=args.workers,
+    )
     return 0
 
 
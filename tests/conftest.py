@@ -1,4 +1,18 @@
 import sys
 from pathlib import Path
+from typing import Any
+
+import pytest
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scraper"))
+
+
+@pytest.fixture
+def html_response():
+    from scrapy.http import HtmlResponse, Request
+
+    def make(url: str, body: bytes, *, meta: dict[str, Any] | None = None) -> HtmlResponse:
+        request = Request(url=url, meta=meta or {})
+        return HtmlResponse(url=url, request=request, body=body, encoding="utf-8")
+
+    return make
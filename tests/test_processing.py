@@ -1,10 +1,16 @@
 import json
 from pathlib import Path
 
+import orjson
 import polars as pl
+import pytest
 from nrsr_attendance.processing import process_votes
 
 
+def _read_jsonl(path: Path) -> list[dict]:
+    return [orjson.loads(line) for line in path.read_bytes().splitlines() if line]
+
+
 def test_process_votes_writes_expected_outputs(tmp_path: Path):
     raw_votes_dir = tmp_path / "raw" / "votes"
     out_dir = tmp_path / "processed"
@@ -75,30 +81,38 @@ def test_process_votes_writes_expected_outputs(tmp_path: Path):
     assert (out_dir / "club_attendance.jsonl").exists()
     assert (out_dir / "metadata.json").exists()
 
-    votes = pl.read_ndjson(out_dir / "votes.jsonl")
-    assert votes.height == 1
-    assert votes.select("vote_id").item() == 1
-    assert votes.select("vote_datetime_local").item() == "2025-12-12T10:06:00+01:00"
-    assert votes.select("vote_datetime_utc").item() == "2025-12-12T09:06:00+00:00"
-    assert votes.select("present").item() == 2
-    assert votes.select("for").item() == 1
-    assert votes.select("against").item() == 1
-
-    mp_votes = pl.read_ndjson(out_dir / "mp_votes" / "term=9" / "meeting=43.jsonl")
-    assert mp_votes.height == 3
-    present_flags = dict(zip(mp_votes["mp_id"].to_list(), mp_votes["is_present"].to_list()))
+    votes = _read_jsonl(out_dir / "votes.jsonl")
+    assert len(votes) == 1
+    vote = votes[0]
+    assert vote["vote_id"] == 1
+    assert vote["vote_datetime_local"] == "2025-12-12T10:06:00+01:00"
+    assert vote["vote_datetime_utc"] == "2025-12-12T09:06:00+00:00"
+    assert vote["present"] == 2
+    assert vote["for"] == 1
+    assert vote["against"] == 1
+
+    mp_votes = _read_jsonl(out_dir / "mp_votes" / "term=9" / "meeting=43.jsonl")
+    assert len(mp_votes) == 3
+    present_flags = {r["mp_id"]: r["is_present"] for r in mp_votes}
     assert present_flags == {10: True, 11: False, 12: False}
 
-    mp_attendance = pl.read_ndjson(out_dir / "mp_attendance.jsonl")
-    assert mp_attendance.height == 3
-    alpha = mp_attendance.filter(pl.col("mp_id") == 10).row(0, named=True)
-    beta = mp_attendance.filter(pl.col("mp_id") == 11).row(0, named=True)
+    mp_votes_parquet = pl.read_parquet(out_dir / "mp_votes" / "term=9" / "meeting=43.parquet")
+    assert mp_votes_parquet.equals(pl.DataFrame(mp_votes).select(mp_votes_parquet.columns))
+    index = json.loads((out_dir / "mp_votes" / "index.json").read_text(encoding="utf-8"))
+    assert index["shards"][0]["parquet_path"] == "mp_votes/term=9/meeting=43.parquet"
+    assert (out_dir / "votes.parquet").exists()
+
+    mp_attendance = _read_jsonl(out_dir / "mp_attendance.jsonl")
+    assert len(mp_attendance) == 3
+    mp_by_id = {r["mp_id"]: r for r in mp_attendance}
+    alpha = mp_by_id[10]
+    beta = mp_by_id[11]
     assert alpha["present_count"] == 1
     assert beta["absent_count"] == 1
 
-    club_attendance = pl.read_ndjson(out_dir / "club_attendance.jsonl")
-    assert club_attendance.height == 1
-    club = club_attendance.row(0, named=True)
+    club_attendance = _read_jsonl(out_dir / "club_attendance.jsonl")
+    assert len(club_attendance) == 1
+    club = club_attendance[0]
     assert club["club"] == "Club A"
     assert club["total_votes"] == 3
     assert club["absent_count"] == 2
@@ -139,12 +153,12 @@ def test_process_votes_normalizes_no_club_label(tmp_path: Path):
 
     process_votes(raw_votes_dir, out_dir, schema_version=1)
 
-    mp_votes = pl.read_ndjson(out_dir / "mp_votes" / "term=9" / "meeting=1.jsonl")
-    assert mp_votes.select("club").item() == "(no_club)"
+    mp_votes = _read_jsonl(out_dir / "mp_votes" / "term=9" / "meeting=1.jsonl")
+    assert [r["club"] for r in mp_votes] == ["(no_club)"]
 
-    club_attendance = pl.read_ndjson(out_dir / "club_attendance.jsonl")
-    assert club_attendance.height == 1
-    assert club_attendance.select("club").item() == "(no_club)"
+    club_attendance = _read_jsonl(out_dir / "club_attendance.jsonl")
+    assert len(club_attendance) == 1
+    assert club_attendance[0]["club"] == "(no_club)"
 
 
 def test_process_votes_does_not_depend_on_polars_inference(tmp_path: Path):
@@ -187,3 +201,38 @@ def test_process_votes_does_not_depend_on_polars_inference(tmp_path: Path):
             if obj.get("result") is not None:
                 non_null_results += 1
     assert non_null_results == 1
+
+
+def test_process_votes_accepts_relative_out_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    # scripts/process_data.py runs with the relative default --out-dir data/processed.
+    monkeypatch.chdir(tmp_path)
+    raw_votes_dir = Path("raw") / "votes"
+    out_dir = Path("processed")
+    raw_votes_dir.mkdir(parents=True)
+
+    (raw_votes_dir / "1.json").write_text(
+        json.dumps(
+            {
+                "kind": "vote",
+                "vote_id": 1,
+                "term_id": 9,
+                "meeting_nr": 43,
+                "summary": {"Dátum a čas": "12. 12. 2025 10:06", "Číslo hlasovania": 1},
+                "stats": {},
+                "mp_votes": [
+                    {"mp_id": 10, "mp_name": "Alpha, A", "club": "Club A", "vote_code": "Z"}
+                ],
+            },
+            ensure_ascii=False,
+        ),
+        encoding="utf-8",
+    )
+
+    process_votes(raw_votes_dir, out_dir, schema_version=1)
+
+    shard = out_dir / "mp_votes" / "term=9" / "meeting=43.jsonl"
+    assert [r["mp_id"] for r in _read_jsonl(shard)] == [10]
+    assert shard.with_suffix(".parquet").exists()
+    index = json.loads((out_dir / "mp_votes" / "index.json").read_text(encoding="utf-8"))
+    assert index["shards"][0]["path"] == "mp_votes/term=9/meeting=43.jsonl"
+    assert not (out_dir / "mp_votes" / "processed").exists()
@@ -4,6 +4,7 @@ import json
 from pathlib import Path
 
 import nrsr_attendance.pipelines as pipelines
+import orjson
 import pytest
 from nrsr_attendance.pipelines import RawJsonPipeline
 
@@ -20,23 +21,30 @@ def test_pipeline_writes_vote_json_and_updates_state(
         "source_url": "https://example.test/vote",
         "fetched_at_utc": "2026-01-01T00:00:00+00:00",
         "http_status": 200,
-        "mp_votes": [],
+        "summary": {"Číslo hlasovania": 149, "Názov hlasovania": "Návrh zákona"},
+        "stats": {"Prítomní": 81},
+        "mp_votes": [{"mp_id": 1, "mp_name": "Ďurovič, Ľ", "club": "Klub A", "vote_code": "Z"}],
     }
 
     pipeline.process_item(item)
 
     vote_path = tmp_path / "data" / "raw" / "votes" / "123.json"
     assert vote_path.exists()
-    saved = json.loads(vote_path.read_text(encoding="utf-8"))
+    saved = orjson.loads(vote_path.read_bytes())
     assert saved["vote_id"] == 123
 
     pipeline._on_spider_closed(spider=None, reason="finished")
 
     state_path = tmp_path / "data" / "raw" / "_state.json"
     assert state_path.exists()
-    state = json.loads(state_path.read_text(encoding="utf-8"))
+    state = orjson.loads(state_path.read_bytes())
     assert state["votes"]["last_seen_id"] == 123
 
+    # Both files keep the layout the stdlib encoder produced before orjson was used.
+    for path, obj in ((vote_path, saved), (state_path, state)):
+        expected = json.dumps(obj, ensure_ascii=False, indent=2, sort_keys=True) + "\n"
+        assert path.read_bytes() == expected.encode("utf-8")
+
 
 def test_pipeline_does_not_overwrite_unless_force(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
     monkeypatch.setattr(pipelines, "_repo_root", lambda: tmp_path)
@@ -46,17 +54,41 @@ def test_pipeline_does_not_overwrite_unless_force(tmp_path: Path, monkeypatch: p
     pipeline.process_item(item)
 
     vote_path = tmp_path / "data" / "raw" / "votes" / "1.json"
-    before = vote_path.read_text(encoding="utf-8")
+    before = vote_path.read_bytes()
 
     # No overwrite by default.
     pipeline.process_item({"kind": "vote", "vote_id": 1, "payload": {"v": 2}})
-    after = vote_path.read_text(encoding="utf-8")
+    after = vote_path.read_bytes()
     assert after == before
 
     # Overwrite when force is set.
     pipeline.process_item(
         {"kind": "vote", "vote_id": 1, "payload": {"v": 3}, "force_overwrite": True}
     )
-    overwritten = vote_path.read_text(encoding="utf-8")
+    overwritten = vote_path.read_bytes()
     assert overwritten != before
-    assert json.loads(overwritten)["payload"]["v"] == 3
+    assert orjson.loads(overwritten)["payload"]["v"] == 3
+
+
+def test_pipeline_skips_forced_rewrite_when_content_is_unchanged(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(pipelines, "_repo_root", lambda: tmp_path)
+
+    pipeline = RawJsonPipeline()
+    item = {
+        "kind": "vote",
+        "vote_id": 1,
+        "payload": {"v": 1},
+        "fetched_at_utc": "2026-01-01T00:00:00+00:00",
+    }
+    pipeline.process_item(item)
+
+    vote_path = tmp_path / "data" / "raw" / "votes" / "1.json"
+    before = vote_path.read_bytes()
+
+    # A forced re-fetch with identical content keeps the original file.
+    pipeline.process_item(
+        {**item, "fetched_at_utc": "2026-02-01T00:00:00+00:00", "force_overwrite": True}
+    )
+    assert vote_path.read_bytes() == before
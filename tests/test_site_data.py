@@ -1,9 +1,18 @@
 import json
 from pathlib import Path
 
+import orjson
+import pytest
 from nrsr_attendance.site_data import build_club_keys, build_site_data, slugify
 
 
+def _write_jsonl(path: Path, records: list[dict]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(
+        b"\n".join(orjson.dumps(r, option=orjson.OPT_SORT_KEYS) for r in records) + b"\n"
+    )
+
+
 def test_slugify_basic():
     assert slugify("Poslanecký klub OĽaNO") == "poslanecky-klub-olano"
     assert slugify("   ") == "unknown"
@@ -25,12 +34,13 @@ def test_build_club_keys_collision_and_reserved():
     assert mapping["Foo Bar"] != mapping["Foo-Bar"]
 
 
-def test_build_site_data_writes_manifest_and_term_overviews(tmp_path: Path):
+@pytest.fixture
+def site_built(tmp_path: Path) -> Path:
     processed = tmp_path / "processed"
     processed.mkdir()
 
-    (processed / "metadata.json").write_text(
-        json.dumps(
+    (processed / "metadata.json").write_bytes(
+        orjson.dumps(
             {
                 "schema_version": 1,
                 "last_updated_utc": "2026-01-24T00:00:00+00:00",
@@ -38,127 +48,218 @@ def test_build_site_data_writes_manifest_and_term_overviews(tmp_path: Path):
                 "votes_rows": 1,
                 "mp_votes_rows": 1,
             },
-            ensure_ascii=False,
-            indent=2,
-            sort_keys=True,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2,
         )
-        + "\n",
-        encoding="utf-8",
+        + b"\n"
     )
 
-    (processed / "mp_attendance.jsonl").write_text(
-        "\n".join(
-            [
-                json.dumps(
-                    {
-                        "term_id": 9,
-                        "mp_id": 1,
-                        "mp_name": "Alpha, A",
-                        "total_votes": 10,
-                        "present_count": 7,
-                        "absent_count": 3,
-                        "participation_rate": 0.7,
-                    },
-                    ensure_ascii=False,
-                    sort_keys=True,
-                ),
-                json.dumps(
-                    {
-                        "term_id": 8,
-                        "mp_id": 2,
-                        "mp_name": "Beta, B",
-                        "total_votes": 5,
-                        "present_count": 5,
-                        "absent_count": 0,
-                        "participation_rate": 1.0,
-                    },
-                    ensure_ascii=False,
-                    sort_keys=True,
-                ),
-            ]
-        )
-        + "\n",
-        encoding="utf-8",
+    _write_jsonl(
+        processed / "mp_attendance.jsonl",
+        [
+            {
+                "term_id": 9,
+                "mp_id": 1,
+                "mp_name": "Alpha, A",
+                "total_votes": 10,
+                "present_count": 7,
+                "absent_count": 3,
+                "participation_rate": 0.7,
+            },
+            {
+                "term_id": 8,
+                "mp_id": 2,
+                "mp_name": "Beta, B",
+                "total_votes": 5,
+                "present_count": 5,
+                "absent_count": 0,
+                "participation_rate": 1.0,
+            },
+        ],
     )
 
-    (processed / "club_attendance.jsonl").write_text(
-        "\n".join(
-            [
-                json.dumps(
-                    {
-                        "term_id": 9,
-                        "club": "(no_club)",
-                        "total_votes": 2,
-                        "present_count": 1,
-                        "absent_count": 1,
-                        "participation_rate": 0.5,
-                    },
-                    ensure_ascii=False,
-                    sort_keys=True,
-                ),
-                json.dumps(
-                    {
-                        "term_id": 8,
-                        "club": "Club A",
-                        "total_votes": 2,
-                        "present_count": 2,
-                        "absent_count": 0,
-                        "participation_rate": 1.0,
-                    },
-                    ensure_ascii=False,
-                    sort_keys=True,
-                ),
-            ]
-        )
-        + "\n",
-        encoding="utf-8",
+    _write_jsonl(
+        processed / "club_attendance.jsonl",
+        [
+            {
+                "term_id": 9,
+                "club": "(no_club)",
+                "total_votes": 2,
+                "present_count": 1,
+                "absent_count": 1,
+                "participation_rate": 0.5,
+            },
+            {
+                "term_id": 8,
+                "club": "Club A",
+                "total_votes": 2,
+                "present_count": 2,
+                "absent_count": 0,
+                "participation_rate": 1.0,
+            },
+        ],
+    )
+
+    _write_jsonl(
+        processed / "votes.jsonl",
+        [
+            {
+                "term_id": 9,
+                "vote_id": 100,
+                "vote_datetime_local": "2025-01-01T00:00:00+01:00",
+                "vote_datetime_utc": "2024-12-31T23:00:00+00:00",
+                "meeting_nr": 1,
+                "vote_number": 1,
+                "title": "X",
+                "result": None,
+            },
+            {
+                "term_id": 8,
+                "vote_id": 200,
+                "vote_datetime_local": "2023-01-01T00:00:00+01:00",
+                "vote_datetime_utc": "2022-12-31T23:00:00+00:00",
+                "meeting_nr": 1,
+                "vote_number": 1,
+                "title": "Y",
+                "result": None,
+            },
+        ],
     )
 
-    (processed / "votes.jsonl").write_text(
-        "\n".join(
-            [
-                json.dumps(
-                    {
-                        "term_id": 9,
-                        "vote_id": 100,
-                        "vote_datetime_local": "2025-01-01T00:00:00+01:00",
-                        "vote_datetime_utc": "2024-12-31T23:00:00+00:00",
-                        "meeting_nr": 1,
-                        "vote_number": 1,
-                        "title": "X",
-                        "result": None,
-                    },
-                    ensure_ascii=False,
-                    sort_keys=True,
-                ),
-                json.dumps(
-                    {
-                        "term_id": 8,
-                        "vote_id": 200,
-                        "vote_datetime_local": "2023-01-01T00:00:00+01:00",
-                        "vote_datetime_utc": "2022-12-31T23:00:00+00:00",
-                        "meeting_nr": 1,
-                        "vote_number": 1,
-                        "title": "Y",
-                        "result": None,
-                    },
-                    ensure_ascii=False,
-                    sort_keys=True,
-                ),
-            ]
+    # Per-meeting mp_votes shards, as process_votes lays them out.
+    _write_jsonl(
+        processed / "mp_votes" / "term=9" / "meeting=1.jsonl",
+        [
+            {
+                "term_id": 9,
+                "meeting_nr": 1,
+                "vote_id": 100,
+                "vote_datetime_utc": "2024-12-31T23:00:00+00:00",
+                "mp_id": 1,
+                "mp_name": "Alpha, A",
+                "club": "(no_club)",
+                "vote_code": "Z",
+                "is_present": True,
+                "is_voted": True,
+            },
+            {
+                "term_id": 9,
+                "meeting_nr": 1,
+                "vote_id": 100,
+                "vote_datetime_utc": "2024-12-31T23:00:00+00:00",
+                "mp_id": 3,
+                "mp_name": "Gamma, G",
+                "club": "Club A",
+                "vote_code": "0",
+                "is_present": False,
+                "is_voted": False,
+            },
+        ],
+    )
+    _write_jsonl(
+        processed / "mp_votes" / "term=8" / "meeting=1.jsonl",
+        [
+            {
+                "term_id": 8,
+                "meeting_nr": 1,
+                "vote_id": 200,
+                "vote_datetime_utc": "2022-12-31T23:00:00+00:00",
+                "mp_id": 2,
+                "mp_name": "Beta, B",
+                "club": "Club A",
+                "vote_code": "Z",
+                "is_present": True,
+                "is_voted": True,
+            },
+        ],
+    )
+    (processed / "mp_votes" / "index.json").write_bytes(
+        orjson.dumps(
+            {
+                "shards": [
+                    {"term_id": 9, "meeting_nr": 1, "path": "mp_votes/term=9/meeting=1.jsonl"},
+                    {"term_id": 8, "meeting_nr": 1, "path": "mp_votes/term=8/meeting=1.jsonl"},
+                ]
+            }
         )
-        + "\n",
-        encoding="utf-8",
     )
 
     out_dir = tmp_path / "site_assets_data"
     build_site_data(processed, out_dir)
+    return out_dir
+
 
+def test_build_site_data_writes_manifest_and_term_overviews(site_built: Path):
+    out_dir = site_built
     manifest = json.loads((out_dir / "manifest.json").read_text(encoding="utf-8"))
     assert manifest["terms"] == [9, 8]
     assert manifest["default_term_id"] == 9
 
-    overview9 = json.loads((out_dir / "term" / "9" / "overview.json").read_text(encoding="utf-8"))
+    overview9_bytes = (out_dir / "term" / "9" / "overview.json").read_bytes()
+    overview9 = json.loads(overview9_bytes)
+    # Written in canonical form: sorted keys at every level, two-space indent.
+    assert overview9_bytes == orjson.dumps(
+        overview9, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE
+    )
     assert overview9["term_id"] == 9
     assert overview9["clubs"][0]["club_key"] == "no-club"
     assert (out_dir / "term" / "9" / "votes.json").exists()
+
+
+def test_build_site_data_breaks_primary_club_ties_by_smallest_label(tmp_path: Path):
+    processed = tmp_path / "processed"
+    processed.mkdir()
+    (processed / "metadata.json").write_bytes(orjson.dumps({"schema_version": 1}))
+    _write_jsonl(
+        processed / "mp_attendance.jsonl",
+        [{"term_id": 9, "mp_id": 1, "mp_name": "Alpha, A", "total_votes": 4}],
+    )
+    _write_jsonl(
+        processed / "club_attendance.jsonl",
+        [{"term_id": 9, "club": "Alpha"}, {"term_id": 9, "club": "Zeta"}],
+    )
+    # Two votes in each club, Zeta first: the tie must still go to the smaller label.
+    votes = [
+        {
+            "term_id": 9,
+            "vote_id": vote_id,
+            "vote_datetime_local": f"2025-01-0{vote_id}T10:00:00+01:00",
+            "vote_datetime_utc": f"2025-01-0{vote_id}T09:00:00+00:00",
+            "meeting_nr": 1,
+            "vote_number": vote_id,
+            "title": f"Vote {vote_id}",
+            "result": None,
+        }
+        for vote_id in (1, 2, 3, 4)
+    ]
+    _write_jsonl(processed / "votes.jsonl", votes)
+    _write_jsonl(
+        processed / "mp_votes" / "term=9" / "meeting=1.jsonl",
+        [
+            {
+                "term_id": 9,
+                "meeting_nr": 1,
+                "vote_id": vote["vote_id"],
+                "vote_datetime_utc": vote["vote_datetime_utc"],
+                "mp_id": 1,
+                "mp_name": "Alpha, A",
+                "club": club,
+                "vote_code": "Z",
+                "is_present": True,
+                "is_voted": True,
+            }
+            for vote, club in zip(votes, ["Zeta", "Zeta", "Alpha", "Alpha"], strict=True)
+        ],
+    )
+    (processed / "mp_votes" / "index.json").write_bytes(
+        orjson.dumps(
+            {"shards": [{"term_id": 9, "meeting_nr": 1, "path": "mp_votes/term=9/meeting=1.jsonl"}]}
+        )
+    )
+
+    out_dir = tmp_path / "site_assets_data"
+    build_site_data(processed, out_dir, workers=1)
+
+    overview = orjson.loads((out_dir / "term" / "9" / "overview.full.abs0n.json").read_bytes())
+    (mp,) = overview["mps"]
+    assert mp["primary_club"] == "Alpha"
+    assert mp["primary_club_key"] == "alpha"
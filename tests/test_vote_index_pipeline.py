@@ -45,6 +45,44 @@ def test_vote_index_pipeline_writes_sorted_deduped_shard(
     p._on_spider_closed(spider=None, reason="finished")
 
     shard = tmp_path / "data" / "raw" / "vote_index" / "9" / "43.jsonl"
-    lines = shard.read_text(encoding="utf-8").splitlines()
-    assert [json.loads(line)["vote_id"] for line in lines] == [1, 2]
-    assert json.loads(lines[1])["title"] == "two-updated"
+    assert shard.read_bytes().splitlines() == [
+        b'{"meeting_id": 43, "term_id": 9, "title": "one", "vote_id": 1}',
+        b'{"meeting_id": 43, "term_id": 9, "title": "two-updated", "vote_id": 2}',
+    ]
+
+
+def test_vote_index_pipeline_records_done_meetings_and_merges_leftover_shards(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(pipelines, "_repo_root", lambda: tmp_path)
+
+    # Interrupted run: meeting 43 is done and merged at once, meeting 45 stays as .tmp.
+    p = pipelines.VoteIndexJsonlPipeline()
+    p.process_item({"kind": "vote_index", "vote_id": 1, "term_id": 8, "meeting_id": 43})
+    p.process_item({"kind": "meeting_done", "term_id": 8, "meeting_id": 43})
+    p.process_item({"kind": "vote_index", "vote_id": 2, "term_id": 8, "meeting_id": 45})
+    p._on_spider_closed(spider=None, reason="shutdown")
+
+    state_path = tmp_path / "data" / "raw" / "_state.json"
+    state = json.loads(state_path.read_text(encoding="utf-8"))
+    assert state["vote_index"]["done_meetings"] == {"8": [43]}
+    # The spider reads back exactly what the pipeline recorded.
+    assert pipelines._load_done_meetings() == {(8, 43)}
+
+    shard_dir = tmp_path / "data" / "raw" / "vote_index" / "8"
+    done_lines = (shard_dir / "43.jsonl").read_text().splitlines()
+    assert [json.loads(line)["vote_id"] for line in done_lines] == [1]
+    assert not (shard_dir / "43.jsonl.tmp").exists()
+    assert (shard_dir / "45.jsonl.tmp").exists()
+
+    # The resumed run skips meeting 43 but still merges the leftover meeting 45 shard.
+    p = pipelines.VoteIndexJsonlPipeline()
+    p.process_item({"kind": "vote_index", "vote_id": 5, "term_id": 8, "meeting_id": 44})
+    p.process_item({"kind": "meeting_done", "term_id": 8, "meeting_id": 44})
+    p._on_spider_closed(spider=None, reason="finished")
+
+    shard = shard_dir / "45.jsonl"
+    assert [json.loads(line)["vote_id"] for line in shard.read_text().splitlines()] == [2]
+    assert not shard.with_suffix(".jsonl.tmp").exists()
+    state = json.loads(state_path.read_text(encoding="utf-8"))
+    assert state["vote_index"]["done_meetings"] == {"8": [43, 44]}
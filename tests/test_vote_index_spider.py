@@ -1,15 +1,6 @@
 from __future__ import annotations
 
-from typing import Any
-
 from nrsr_attendance.spiders.vote_index import VoteIndexSpider
-from scrapy.http import HtmlResponse, Request
-
-
-def _html_response(url: str, body: str, *, meta: dict[str, Any] | None = None) -> HtmlResponse:
-    request = Request(url=url, meta=meta or {})
-    return HtmlResponse(url=url, request=request, body=body.encode("utf-8"), encoding="utf-8")
-
 
 LISTING_HTML = """
 <html>
@@ -39,7 +30,7 @@ LISTING_HTML = """
     </table>
   </body>
 </html>
-""".strip()
+""".strip().encode()
 
 
 MEETING_PAGE_1 = """
@@ -79,12 +70,12 @@ MEETING_PAGE_1 = """
     </form>
   </body>
 </html>
-""".strip()
+""".strip().encode()
 
 
-def test_vote_index_update_mode_yields_vote_index_items():
+def test_vote_index_update_mode_yields_vote_index_items(html_response):
     spider = VoteIndexSpider(mode="update")
-    response = _html_response("https://www.nrsr.sk/web/default.aspx?SectionId=108", LISTING_HTML)
+    response = html_response("https://www.nrsr.sk/web/default.aspx?SectionId=108", LISTING_HTML)
     out = list(spider.parse(response))
     assert out[0]["kind"] == "vote_index"
     assert out[0]["vote_id"] == 57432
@@ -92,9 +83,9 @@ def test_vote_index_update_mode_yields_vote_index_items():
     assert out[0]["meeting_id"] == 43
 
 
-def test_vote_index_meeting_results_paginates_via_postback():
+def test_vote_index_meeting_results_paginates_via_postback(html_response):
     spider = VoteIndexSpider(mode="backfill")
-    response = _html_response(
+    response = html_response(
         "https://www.nrsr.sk/web/Default.aspx?sid=schodze/hlasovanie/vyhladavanie_vysledok&ZakZborID=13&CisObdobia=9&CisSchodze=43&ShowCisloSchodze=False",
         MEETING_PAGE_1,
     )
@@ -109,6 +100,21 @@ def test_vote_index_meeting_results_paginates_via_postback():
     assert items[0]["vote_id"] == 57277
     assert reqs and reqs[0].method == "POST"
 
+    # A later page repeating a row of this meeting does not emit it again.
+    seen_vote_ids = reqs[0].cb_kwargs["seen_vote_ids"]
+    assert seen_vote_ids == {57277}
+    out = list(
+        spider._parse_meeting_results(
+            response,
+            term_id=9,
+            meeting_id=43,
+            meeting_label="43. schôdza",
+            page=2,
+            seen_vote_ids=seen_vote_ids,
+        )
+    )
+    assert not [x for x in out if isinstance(x, dict) and x["kind"] == "vote_index"]
+
 
 MEETING_PAGE_NO_MEETING_COL = """
 <html>
@@ -137,12 +143,12 @@ MEETING_PAGE_NO_MEETING_COL = """
     </form>
   </body>
 </html>
-""".strip()
+""".strip().encode()
 
 
-def test_vote_index_meeting_results_handles_hidden_meeting_column():
+def test_vote_index_meeting_results_handles_hidden_meeting_column(html_response):
     spider = VoteIndexSpider(mode="backfill")
-    response = _html_response(
+    response = html_response(
         "https://www.nrsr.sk/web/Default.aspx?sid=schodze/hlasovanie/vyhladavanie_vysledok&ZakZborID=13&CisObdobia=9&CisSchodze=43&ShowCisloSchodze=False",
         MEETING_PAGE_NO_MEETING_COL,
     )
@@ -156,3 +162,57 @@ def test_vote_index_meeting_results_handles_hidden_meeting_column():
     assert item["date_time_text"].startswith("25.11.2025")
     assert item["vote_number"] == 1
     assert item["title"] == "Prezentácia č. 1"
+
+
+def test_vote_index_backfill_raises_concurrency_only_for_backfill():
+    # The spider module does not pull in scrapy.crawler, so only this test pays for it.
+    from scrapy.crawler import Crawler
+
+    backfill = Crawler(VoteIndexSpider)
+    VoteIndexSpider.from_crawler(backfill, mode="backfill")
+    assert backfill.settings.getint("CONCURRENT_REQUESTS_PER_DOMAIN") == 8
+    assert backfill.settings.getfloat("AUTOTHROTTLE_TARGET_CONCURRENCY") == 4.0
+
+    update = Crawler(VoteIndexSpider)
+    VoteIndexSpider.from_crawler(update, mode="update")
+    assert update.settings.getint("CONCURRENT_REQUESTS_PER_DOMAIN") == 2
+
+
+def test_vote_index_marks_meeting_done_on_last_page_and_skips_it_later(monkeypatch, html_response):
+    spider = VoteIndexSpider(mode="backfill")
+    response = html_response(
+        "https://www.nrsr.sk/web/Default.aspx?sid=schodze/hlasovanie/vyhladavanie_vysledok&ZakZborID=13&CisObdobia=8&CisSchodze=43&ShowCisloSchodze=False",
+        MEETING_PAGE_NO_MEETING_COL,
+    )
+    # Until the listing page tells which term is current, no meeting is marked done.
+    out = list(
+        spider._parse_meeting_results(
+            response, term_id=8, meeting_id=43, meeting_label="43. schôdza", page=1
+        )
+    )
+    assert all(x.get("kind") != "meeting_done" for x in out if isinstance(x, dict))
+
+    spider._current_term = 9
+    out = list(
+        spider._parse_meeting_results(
+            response, term_id=8, meeting_id=43, meeting_label="43. schôdza", page=1
+        )
+    )
+    assert out[-1] == {"kind": "meeting_done", "term_id": 8, "meeting_id": 43}
+
+    monkeypatch.setattr("nrsr_attendance.spiders.vote_index._load_done_meetings", lambda: {(8, 43)})
+    spider = VoteIndexSpider(mode="backfill")
+    term_page = html_response(
+        "https://www.nrsr.sk/web/default.aspx?SectionId=108",
+        """
+        <select id="_sectionLayoutContainer_ctl01__meetingNrCombo">
+          <option value="0">Všetky</option>
+          <option value="43">43. schôdza</option>
+          <option value="44">44. schôdza</option>
+        </select>
+        """.encode(),
+    )
+    reqs = list(spider._schedule_meetings_for_term(term_page, 8))
+    assert [r.cb_kwargs["meeting_id"] for r in reqs] == [44]
+    forced = VoteIndexSpider(mode="backfill", force="1")
+    assert len(list(forced._schedule_meetings_for_term(term_page, 8))) == 2
@@ -1,16 +1,7 @@
 from __future__ import annotations
 
-from typing import Any
-
 import pytest
 from nrsr_attendance.spiders.votes import VotesSpider
-from scrapy.http import HtmlResponse, Request
-
-
-def _html_response(url: str, body: str, *, meta: dict[str, Any] | None = None) -> HtmlResponse:
-    request = Request(url=url, meta=meta or {})
-    return HtmlResponse(url=url, request=request, body=body.encode("utf-8"), encoding="utf-8")
-
 
 LISTING_HTML = """
 <html>
@@ -37,7 +28,7 @@ LISTING_HTML = """
     </table>
   </body>
 </html>
-""".strip()
+""".strip().encode()
 
 
 HLASKLUB_HTML = """
@@ -81,7 +72,7 @@ HLASKLUB_HTML = """
     </table>
   </body>
 </html>
-""".strip()
+""".strip().encode()
 
 HLASKLUB_HTML_UNSORTED = """
 <html>
@@ -99,14 +90,14 @@ HLASKLUB_HTML_UNSORTED = """
     </table>
   </body>
 </html>
-""".strip()
+""".strip().encode()
 
 
-def test_votes_spider_parse_is_incremental():
+def test_votes_spider_parse_is_incremental(html_response):
     spider = VotesSpider()
     spider._last_seen_id = 57431
 
-    response = _html_response("https://www.nrsr.sk/web/default.aspx?SectionId=108", LISTING_HTML)
+    response = html_response("https://www.nrsr.sk/web/default.aspx?SectionId=108", LISTING_HTML)
     out = list(spider.parse(response))
 
     # Only the new vote should be followed.
@@ -118,20 +109,20 @@ def test_votes_spider_parse_is_incremental():
     assert req.meta["meeting_nr"] == 43
 
 
-def test_votes_spider_parse_yields_nothing_when_no_new_votes():
+def test_votes_spider_parse_yields_nothing_when_no_new_votes(html_response):
     spider = VotesSpider()
     spider._last_seen_id = 999999
 
-    response = _html_response("https://www.nrsr.sk/web/default.aspx?SectionId=108", LISTING_HTML)
+    response = html_response("https://www.nrsr.sk/web/default.aspx?SectionId=108", LISTING_HTML)
     out = list(spider.parse(response))
     assert out == []
 
 
-def test_votes_spider_force_fetches_listing_page_even_if_state_is_up_to_date():
+def test_votes_spider_force_fetches_listing_page_even_if_state_is_up_to_date(html_response):
     spider = VotesSpider(force="1")
     spider._last_seen_id = 999999  # should be ignored when force is enabled
 
-    response = _html_response("https://www.nrsr.sk/web/default.aspx?SectionId=108", LISTING_HTML)
+    response = html_response("https://www.nrsr.sk/web/default.aspx?SectionId=108", LISTING_HTML)
     out = list(spider.parse(response))
 
     assert {r.meta["vote_id"] for r in out} == {57432, 57431}
@@ -145,9 +136,9 @@ def test_votes_spider_force_fetches_listing_page_even_if_state_is_up_to_date():
         ("https://www.nrsr.sk/web/Default.aspx?sid=schodze/hlasovanie/hlasklub&ID=1", 1),
     ],
 )
-def test_votes_spider_parse_vote_extracts_codes(url: str, expected_id: int):
+def test_votes_spider_parse_vote_extracts_codes(url: str, expected_id: int, html_response):
     spider = VotesSpider()
-    response = _html_response(
+    response = html_response(
         url,
         HLASKLUB_HTML,
         meta={"term_id": 9, "meeting_nr": 43, "cpt_id": None, "title_from_listing": None},
@@ -162,9 +153,9 @@ def test_votes_spider_parse_vote_extracts_codes(url: str, expected_id: int):
     assert {m["mp_id"] for m in item["mp_votes"]} == {1, 2, 3}
 
 
-def test_votes_spider_parse_vote_sorts_mp_votes_deterministically():
+def test_votes_spider_parse_vote_sorts_mp_votes_deterministically(html_response):
     spider = VotesSpider()
-    response = _html_response(
+    response = html_response(
         "https://www.nrsr.sk/web/Default.aspx?sid=schodze/hlasovanie/hlasklub&ID=1",
         HLASKLUB_HTML_UNSORTED,
         meta={"term_id": 9, "meeting_nr": 43, "cpt_id": None, "title_from_listing": None},